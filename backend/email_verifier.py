@@ -4,21 +4,40 @@ Implements comprehensive email verification with point-based scoring (0-100)
 Following the EMAIL VERIFICATION SCORING RULES
 """
 
+import asyncio
+import bisect
+import copy
+import dns.asyncresolver
+import dns.exception
 import dns.resolver
+import dns.reversename
+import errno
+import functools
+import hashlib
+import ipaddress
+import math
+import selectors
 import smtplib
 import socket
 import os
 import random
 import string
+import struct
 import threading
 import time
 import re
 import ssl
-from typing import Any, Dict, List, Optional, Tuple
+import statistics
+from collections import OrderedDict, defaultdict, deque
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+from typing import Any, Deque, Dict, List, Optional, Tuple
 import logging
 import json
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timedelta, timezone
 try:
     # Preferred relative import when running as a package
     from . import internet_check as internet_check_module
@@ -26,16 +45,299 @@ except Exception:
     # Fall back to top-level import for test scripts or simple runs
     import internet_check as internet_check_module
 
+try:
+    # Optional: match provider and MX/banner patterns in one pass when pyahocorasick is installed
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Optional: persist slow-changing lookups across restarts when diskcache is installed
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    # Optional: lenient parser for WHOIS dates and non-standard certificate dates
+    from dateutil import parser as _dtparser
+except ImportError:
+    _dtparser = None
+
 
 logger = logging.getLogger(__name__)
 
 # Optional: per-domain overrides for internal/testing use.
 DOMAIN_CONFIDENCE_OVERRIDES: Dict[str, Dict[str, Any]] = {}
 
+# RFC 5322 compliant regex (simplified but effective), compiled once for _check_syntax
+_EMAIL_SYNTAX_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# MX hosts of transactional email services; SMTP probing is skipped for these
+_TRANSACTIONAL_MX_RE = re.compile('|'.join(map(re.escape, [
+    'inbound-smtp', 'amazonaws.com', 'sendgrid.net',
+    'mailgun.org', 'mailgun.com', 'sparkpostmail.com',
+    'postmarkapp.com', 'mandrillapp.com',
+])))
+
+
+def _build_automaton(patterns):
+    """Aho-Corasick automaton over patterns, or None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, pattern in enumerate(patterns):
+        automaton.add_word(pattern, (index, pattern))
+    automaton.make_automaton()
+    return automaton
+
+
+def _first_pattern(text: str, patterns, automaton) -> Optional[str]:
+    """First of patterns (in list order) occurring in text, in one pass when an
+    automaton built by _build_automaton is given"""
+    if automaton is not None:
+        matches = [match for _, match in automaton.iter(text)]
+        return min(matches)[1] if matches else None
+    for pattern in patterns:
+        if pattern in text:
+            return pattern
+    return None
+
+
+# Known trusted MX brands: host substring -> brand
+_TRUSTED_MX_BRANDS: Dict[str, str] = {
+    "google.com": "Gmail",
+    "outlook.com": "Microsoft",
+    "secureserver.net": "GoDaddy",
+    "privateemail.com": "Namecheap",
+    "mailsrvr.com": "Rackspace",
+    "amazonaws.com": "AWS SES",
+    "sendgrid.net": "SendGrid",
+    "mailgun.org": "Mailgun",
+    "mailgun.com": "Mailgun",
+    "zoho.com": "Zoho",
+    "yahoo.com": "Yahoo",
+    "aol.com": "AOL"
+}
+_TRUSTED_MX_AC = _build_automaton(_TRUSTED_MX_BRANDS)
+
+# SMTP banner patterns naming real MTA software / providers, and ones that look fake
+_PROFESSIONAL_BANNER_PATTERNS: List[str] = [
+    "esmtp", "postfix", "sendmail", "exim", "microsoft", "exchange",
+    "mailjet", "sendgrid", "mailgun", "amazon", "google"
+]
+_PROFESSIONAL_BANNER_AC = _build_automaton(_PROFESSIONAL_BANNER_PATTERNS)
+_SUSPICIOUS_BANNER_PATTERNS: List[str] = ["test", "fake", "honeypot", "spam"]
+_SUSPICIOUS_BANNER_AC = _build_automaton(_SUSPICIOUS_BANNER_PATTERNS)
+
+
+# SMTP reply codes (ints, as smtplib returns them) accepting a recipient / rejecting a malformed command
+_SMTP_OK_CODES = frozenset({250, 251})
+_SMTP_SYNTAX_ERROR_CODES = frozenset({500, 501, 502})
+
+# RCPT TO reply classification: code -> (result flags to set, points, error)
+_RCPT_CODE_TABLE: Dict[int, Tuple[Tuple[str, ...], int, Optional[str]]] = {
+    250: (("accepted",), 10, None),  # Email might exist (soft acceptance)
+    251: (("accepted",), 10, None),
+    450: (("soft_failure",), 10, "Temporarily unavailable (greylisted)"),  # Soft failures / Greylisting
+    451: (("soft_failure",), 10, "Temporarily unavailable (greylisted)"),
+    421: (("soft_failure",), 10, "Service unavailable, try again later"),  # Try again later
+}
+_USER_UNKNOWN_RE = re.compile(r'user unknown|5\.1\.1', re.IGNORECASE)
+
+# SMTP error classification in priority order: (category, points, pattern, keywords)
+_SMTP_ERROR_CATEGORIES: List[Tuple[str, int, str, Tuple[str, ...]]] = [
+    ("rate_limited", 5, "Rate limited", ("rate limit", "too many", "429")),  # Provider exists, mailbox likely exists
+    ("greylist", 10, "Greylisted", ("greylist", "451", "temporarily")),  # Mailbox exists but temporarily blocked
+    ("policy_block", 3, "Policy block", ("policy", "privacy", "not allowed")),  # Domain protects privacy
+    ("connection_refused", 3, "Connection refused", ("refused",)),  # Server alive but private
+    ("dead_server", -20, "Dead server", ("timeout", "dead", "no route")),  # Domain inactive
+    ("connection_reset", 0, "Connection reset", ("reset",)),
+]
+_SMTP_ERROR_PRIORITY = {category: rank for rank, (category, *_) in enumerate(_SMTP_ERROR_CATEGORIES)}
+_SMTP_ERROR_RE = re.compile('|'.join(
+    f"(?P<{category}>{'|'.join(map(re.escape, keywords))})"
+    for category, _, _, keywords in _SMTP_ERROR_CATEGORIES
+))
+
+# Keywords the blocklist-behaviour and strictness heuristics look for in SMTP errors
+_REJECTION_RE = re.compile(
+    r'(?P<user_unknown>user unknown)|(?P<timeout>timeout)|(?P<policy>policy)'
+    r'|(?P<antispam>spam|block)|(?P<mail>mail)',
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _rejection_labels(error: str) -> frozenset:
+    """Names of the _REJECTION_RE groups occurring in error, from one scan"""
+    return frozenset(match.lastgroup for match in _REJECTION_RE.finditer(error))
+
+
+# Score thresholds and the (status, reason) for each band: <20, 20-49, 50-69, 70-89, >=90
+_STATUS_BINS = (20, 50, 70, 90)
+_STATUSES = [
+    ("invalid", "Definitely invalid"),
+    ("likely_invalid", "Likely invalid"),
+    ("uncertain", "Uncertain (common when SMTP blocks verification)"),
+    ("likely_valid", "Probably valid but unconfirmed"),
+    ("valid", "Very likely valid"),
+]
+
+# RCPT latency bands (pattern, points): <0.5s, 0.5-3s, >3-10s, >10s. The bins are the
+# inclusive upper bounds of the bands after the instant one.
+_LATENCY_BINS = (3, 10)
+_LATENCY_PATTERNS = (("instant_reject", -10), ("normal", 8), ("slow", 0), ("very_slow", -5))
+
+# MX count bands (redundancy, points): 0, 1, 2-4, >=5
+_MX_REDUNDANCY_BINS = (1, 2, 5)
+_MX_REDUNDANCY_LEVELS = (("none", -20), ("single", -3), ("strong", 5), ("excessive", 3))
+
+def _finalize_score(score: int) -> Tuple[int, int]:
+    """Clamp the raw score to 0-100 and return it with its _STATUSES index"""
+    score = max(0, min(100, score))
+    return score, bisect.bisect_right(_STATUS_BINS, score)
+
+
+@functools.lru_cache(maxsize=4096)
+def _reverse_ip(ip_address: str) -> str:
+    """DNSBL query prefix for an IP: reversed octets for IPv4, reversed nibbles for IPv6"""
+    if ':' not in ip_address:
+        a, b, c, d = ip_address.split('.', 3)
+        return f"{d}.{c}.{b}.{a}"
+    return ipaddress.ip_address(ip_address).reverse_pointer[:-len('.ip6.arpa')]
+
+# SO_LINGER on, zero timeout: close() aborts the connection with a RST
+_LINGER_RST = struct.pack('ii', 1, 0)
+
+# Leading fields of Linux struct tcp_info, through tcpi_total_retrans
+_TCP_INFO = struct.Struct('8B24I')
+_TCPI_TOTAL_RETRANS = 31
+
+# TLS protocol versions the STARTTLS policy check counts as modern
+_MODERN_TLS_VERSIONS = frozenset({'TLSv1.2', 'TLSv1.3'})
+
+# Domain used in MAIL FROM; resolved once per process since getfqdn() may do a reverse lookup
+_SENDER_FQDN = os.getenv('VERIFIER_SENDER_DOMAIN') or socket.getfqdn()
+
+# Public resolvers that every DNS query is raced against, next to the system resolver.
+# Set VERIFIER_RACE_NAMESERVERS to an empty string to only use the system resolver.
+RACE_NAMESERVERS: List[str] = [
+    ns.strip() for ns in os.getenv('VERIFIER_RACE_NAMESERVERS', '8.8.8.8,1.1.1.1').split(',') if ns.strip()
+]
+
+# IP blocklists queried for MX reputation, as (source name, DNSBL zone)
+IP_DNSBL_ZONES: List[Tuple[str, str]] = [
+    ("spamhaus", "zen.spamhaus.org"),
+    ("barracuda", "b.barracudacentral.org"),
+    ("spamcop", "bl.spamcop.net"),
+]
+
+# Domain blocklists queried for the recipient domain, as (source name, DNSBL zone)
+DOMAIN_DNSBL_ZONES: List[Tuple[str, str]] = [
+    ("spamhaus_dbl", "dbl.spamhaus.org"),
+    ("surbl", "multi.surbl.org"),
+]
+
+
+def _private_dir(path: str) -> str:
+    """Create path with mode 0700 if missing, refusing one another user owns or can write to"""
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.stat(path)
+    if hasattr(os, 'getuid') and (st.st_uid != os.getuid() or st.st_mode & 0o022):
+        raise PermissionError(f"{path} must be owned by this user and not group/world-writable")
+    return path
+
+
+# OpenSSL verify codes (X509_V_ERR_*) behind a rejected STARTTLS certificate
+_X509_CERT_HAS_EXPIRED = 10
+_X509_SELF_SIGNED_CODES = frozenset({18, 19})  # DEPTH_ZERO_SELF_SIGNED_CERT, SELF_SIGNED_CERT_IN_CHAIN
+
+
+class SMTPSlotUnavailable(Exception):
+    """No per-MX connection slot freed up in time. The cap is ours, so this says
+    nothing about the remote server; checks score it as skipped."""
+
+
+class _PooledSMTP(smtplib.SMTP):
+    """SMTP session that remembers when it has to be retired from the pool"""
+    pool_expires_at: float = 0.0
+    pool_messages: int = 0  # transactions completed on this connection
+    greeting: Tuple[int, bytes] = (0, b"")
+    mx_slot: Optional[threading.BoundedSemaphore] = None  # per-MX connection slot held while open
+    slot_wait: float = 0.0  # seconds the last checkout queued for a free session or slot
+    handshake_time: float = 0.0  # seconds spent on connect, greeting and EHLO when opened
+    pool_reused: bool = False  # the last checkout came from the idle pool
+    
+    def _get_socket(self, host, port, timeout):
+        # close() aborts with a RST so short probe sessions leave no TIME_WAIT behind
+        sock = super()._get_socket(host, port, timeout)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RST)
+        return sock
+    
+    def ehlo(self, name=''):
+        started = time.monotonic()
+        try:
+            return super().ehlo(name)
+        finally:
+            self.handshake_time += time.monotonic() - started
+    
+    def close(self):
+        try:
+            super().close()
+        finally:
+            slot, self.mx_slot = self.mx_slot, None
+            if slot is not None:
+                slot.release()
+
+
+class _DNSAnswerCache(dns.resolver.LRUCache):
+    """dnspython's TTL-honouring LRU, with negative answers (NXDOMAIN, NoAnswer)
+    kept no longer than negative_ttl. Their SOA-minimum TTL is often hours, and a
+    freshly registered domain or newly published record should show up quickly."""
+    
+    def __init__(self, max_size: int = 10000, negative_ttl: float = 60):
+        super().__init__(max_size)
+        self.negative_ttl = negative_ttl
+    
+    def put(self, key, value) -> None:
+        if value.rrset is None:
+            value.expiration = min(value.expiration, time.time() + self.negative_ttl)
+        super().put(key, value)
+
+
+class _BloomFilter:
+    """Fixed-size Bloom filter over strings (no false negatives, tunable false positives)"""
+    
+    def __init__(self, capacity: int, error_rate: float = 1e-4):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+    
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+    
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
 
 class EmailVerifier:
     """Main email verification class with point-based scoring (0-100)"""
     
+    # Loading the trust store is expensive, so every TLS check shares one context
+    _SSL_CTX = ssl.create_default_context()
+    # The TLS policy check grades protocol and cipher only; certificates are checked separately
+    _SSL_CTX_NOVERIFY = ssl.create_default_context()
+    _SSL_CTX_NOVERIFY.check_hostname = False
+    _SSL_CTX_NOVERIFY.verify_mode = ssl.CERT_NONE
+    
     def __init__(self):
         self.timeout = 5  # seconds (reduced for faster response)
         self.smtp_timeout = 8  # seconds for SMTP operations (reduced)
@@ -47,8 +349,14 @@ class EmailVerifier:
             'aol.com', 'icloud.com', 'me.com', 'mac.com',
             'microsoft.com', 'office365.com'
         ]
+        self._blocked_domain_set = frozenset(self.smtp_blocked_domains)
+        self._blocked_suffix_re = re.compile(
+            r'(?:^|\.)(?:' + '|'.join(map(re.escape, self.smtp_blocked_domains)) + r')$'
+        )
         self.cache_ttl = 3600  # seconds
-        self._cache_lock = threading.Lock()
+        self._cache_lock = threading.Lock()  # guards the SMTP session pool
+        # One lock per cache dict (keyed by id), so lookups in different caches never contend
+        self._cache_locks: Dict[int, threading.Lock] = {}
         self._mx_cache: Dict[str, Dict[str, Any]] = {}
         self._deliverability_cache: Dict[str, Dict[str, Any]] = {}
         self._domain_age_cache: Dict[str, Dict[str, Any]] = {}
@@ -56,6 +364,85 @@ class EmailVerifier:
         self._provider_fingerprint_cache: Dict[str, Dict[str, Any]] = {}
         self._ip_reputation_cache: Dict[str, Dict[str, Any]] = {}
         self._mx_popularity_cache: Dict[str, Dict[str, Any]] = {}
+        # Per-MX probe results; popular providers share MX hosts across many domains
+        self._mx_tls_cache: Dict[str, Dict[str, Any]] = {}
+        self._mx_tls_policy_cache: Dict[str, Dict[str, Any]] = {}
+        self.tls_policy_ttl = 86400  # seconds; MX TLS configuration rarely changes
+        self._mx_ptr_cache: Dict[str, Dict[str, Any]] = {}
+        self._mx_ports_cache: Dict[str, Dict[str, Any]] = {}
+        self._mx_quit_cache: Dict[str, Dict[str, Any]] = {}
+        self._mx_consistency_cache: Dict[str, Dict[str, Any]] = {}
+        self._domain_blacklist_cache: Dict[str, Dict[str, Any]] = {}
+        # Failed (skipped) probes are cached briefly too, so a batch does not pay
+        # the connect timeout of an unreachable MX once per email
+        self.negative_cache_ttl = 60  # seconds
+        # On-disk second level behind these caches, shared by worker processes and
+        # surviving restarts: id(cache) -> (namespace, ttl). Off unless a directory is
+        # configured; diskcache unpickles what it reads, so only a private one is used.
+        self._disk_cache = None
+        self._disk_tiers: Dict[int, Tuple[str, float]] = {}
+        disk_cache_dir = os.getenv('VERIFIER_DISK_CACHE_DIR')
+        if diskcache is not None and disk_cache_dir:
+            try:
+                self._disk_cache = diskcache.Cache(_private_dir(disk_cache_dir))
+                self._disk_tiers = {
+                    id(self._deliverability_cache): ("deliverability", 3600),
+                    id(self._web_presence_cache): ("web_presence", 1800),
+                    id(self._mx_ptr_cache): ("mx_ptr", 86400),
+                    id(self._mx_tls_policy_cache): ("mx_tls_policy", 86400),
+                    id(self._mx_consistency_cache): ("mx_consistency", 3600),
+                    id(self._domain_blacklist_cache): ("domain_blacklists", 3600),
+                }
+            except Exception as e:
+                logger.debug(f"Disk cache unavailable at {disk_cache_dir}: {str(e)}")
+        # First MX (in preference order) that answered on port 25, per domain
+        self._working_mx_cache: Dict[str, Dict[str, Any]] = {}
+        self.working_mx_ttl = 600  # seconds
+        self.smtp_max_mx_probes = 3  # MX hosts tried before giving up on a domain
+        # Wall-clock budget for the dispatched checks of one email; stragglers
+        # past it are scored as skipped instead of holding up the result
+        self.checks_deadline = 45  # seconds
+        # Shared HTTP session so web presence probes reuse keep-alive connections.
+        # Connect failures are not retried; a dead site should fail within one timeout.
+        self._http = requests.Session()
+        http_adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=64,
+            max_retries=Retry(total=1, connect=0, backoff_factor=0.1),
+        )
+        self._http.mount('https://', http_adapter)
+        self._http.mount('http://', http_adapter)
+        # Full verify_email results, keyed by email and options; LRU-trimmed to result_cache_max
+        self.result_cache_max = 10000
+        self._result_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Idle SMTP sessions per (mx_host, port). Sessions are checked out
+        # exclusively and returned after RSET, so concurrent checks never share one.
+        self.smtp_pool_ttl = 90  # seconds, well below the RFC 5321 5-minute idle timeout
+        self.smtp_max_msgs_per_conn = 100  # retire a session after this many transactions
+        self._smtp_pool: Dict[Tuple[str, int], Deque[_PooledSMTP]] = {}
+        # Idle sessions past their TTL are swept on checkout and release, for every
+        # MX host, so hosts no longer being verified do not keep sockets open
+        self.smtp_sweep_interval = 5  # seconds between sweeps
+        self._smtp_swept_at = 0.0
+        # Concurrent connections per MX host (idle pooled ones included), so parallel
+        # checks and batches never flood a single server
+        self.smtp_max_sessions_per_mx = 4
+        self.smtp_slot_wait = 30  # seconds to wait for a free connection slot
+        self._mx_slots: Dict[str, threading.BoundedSemaphore] = {}
+        # MX circuit breaker: after mx_failure_threshold connect failures within
+        # mx_failure_window seconds, the host is skipped for mx_circuit_cooldown seconds
+        self.mx_failure_threshold = 3
+        self.mx_failure_window = 60  # seconds
+        self.mx_circuit_cooldown = self.cache_ttl
+        self._mx_failure_lock = threading.Lock()
+        self._mx_failure_cache: Dict[str, Tuple[int, float]] = {}
+        self._mx_circuit_open_until: Dict[str, float] = {}
+        # Rolling SMTP latencies per MX host; once enough samples exist, timeouts
+        # shrink to twice their p95 (never above the configured timeout)
+        self.mx_latency_min_samples = 10
+        self.mx_timeout_floor = 1.0  # seconds
+        self._mx_latency_lock = threading.Lock()
+        self._mx_latency: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=128))
         
         # Provider-Level Behavior Rules (PLBR)
         self.provider_rules = {
@@ -72,23 +459,398 @@ class EmailVerifier:
             'me.com': {'max_score_without_rcpt': 50, 'always_blocks': True},
             'mac.com': {'max_score_without_rcpt': 50, 'always_blocks': True},
         }
+        self._provider_ac = _build_automaton(self.provider_rules)
         self.enable_internet_checks = os.getenv('ENABLE_INTERNET_CHECKS', 'true').lower() in ('1', 'true', 'yes')
         self.hibp_enabled = os.getenv('ENABLE_HIBP', 'true').lower() in ('1', 'true', 'yes')
-        self._sender_domain = os.getenv('VERIFIER_SENDER_DOMAIN') or socket.getfqdn()
+        self._sender_domain = _SENDER_FQDN
+        # Optional offline DBL/RHSBL snapshot (one listed domain per line). When loaded,
+        # only domains that hit the Bloom filter are confirmed over DNS.
+        self.dbl_snapshot_path = os.getenv('VERIFIER_DBL_SNAPSHOT')
+        self.dbl_snapshot_refresh = 3600  # seconds between snapshot mtime checks
+        self._dbl_bloom: Optional[_BloomFilter] = None
+        self._dbl_snapshot_mtime = 0.0
+        self._dbl_snapshot_checked_at = 0.0
+        self._dbl_snapshot_lock = threading.Lock()
+        # Shared pool for the network-bound checks fanned out by verify_email.
+        # Tasks running on it must never block on other futures from the same pool.
+        self._executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="email-verifier")
+        # Leaf HTTP probes only (they never wait on other futures), so checks running
+        # on _executor can block on them without risking a deadlock
+        self._http_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="email-verifier-http")
+        # Single blocking SMTP attempts awaited from the event loop, so greylist
+        # retries wait out their delays without holding an _executor thread
+        self._smtp_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="email-verifier-smtp")
+        # Leaf QUITs of sessions leaving the pool. A QUIT never waits on a connection
+        # slot, so the slots these sessions hold are freed even while every
+        # _executor worker is itself waiting for one
+        self._quit_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="email-verifier-quit")
+        # Blocking lookups (deliverability, DNSBLs) share one resolver instead of
+        # re-reading resolv.conf for every query
+        self._resolver = dns.resolver.Resolver()
+        self._resolver.timeout = 2.0
+        self._resolver.lifetime = 4.0
+        # All resolvers share one TTL-honouring answer cache, so lookups repeated
+        # across emails of the same domain are answered locally
+        self._dns_cache = _DNSAnswerCache(10000, negative_ttl=60)
+        self._resolver.cache = self._dns_cache
+        # DNS lookups are issued as coroutines on one long-lived event loop so a
+        # single check can fan out many queries without extra threads.
+        self._async_resolver = dns.asyncresolver.Resolver()
+        self._async_resolver.timeout = 2.0
+        self._async_resolver.lifetime = 4.0
+        self._async_resolver.cache = self._dns_cache
+        self._race_resolvers = [self._async_resolver]
+        for nameserver in RACE_NAMESERVERS:
+            race_resolver = dns.asyncresolver.Resolver(configure=False)
+            race_resolver.nameservers = [nameserver]
+            race_resolver.timeout = 2.0
+            race_resolver.lifetime = 4.0
+            race_resolver.cache = self._dns_cache
+            self._race_resolvers.append(race_resolver)
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="email-verifier-dns", daemon=True).start()
+
+    def _lock_for(self, cache: Dict[str, Dict[str, Any]]) -> threading.Lock:
+        lock = self._cache_locks.get(id(cache))
+        if lock is None:
+            # setdefault is atomic, so racing threads still end up sharing one lock
+            lock = self._cache_locks.setdefault(id(cache), threading.Lock())
+        return lock
 
     def _get_cached(self, cache: Dict[str, Dict[str, Any]], key: str) -> Optional[Dict[str, Any]]:
-        with self._cache_lock:
+        with self._lock_for(cache):
             entry = cache.get(key)
-            if not entry:
-                return None
-            if entry["expires_at"] > time.time():
-                return entry["value"]
-            cache.pop(key, None)
+            if entry:
+                if entry["expires_at"] > time.time():
+                    if isinstance(cache, OrderedDict):
+                        cache.move_to_end(key)
+                    return entry["value"]
+                cache.pop(key, None)
+        
+        tier = self._disk_tiers.get(id(cache))
+        if tier is None:
             return None
+        try:
+            value, expires_at = self._disk_cache.get(f"{tier[0]}:{key}", expire_time=True)
+        except Exception as e:
+            logger.debug(f"Disk cache read error for {key}: {str(e)}")
+            return None
+        if value is None:
+            return None
+        with self._lock_for(cache):
+            cache[key] = {"value": value, "expires_at": expires_at or time.time() + tier[1]}
+        return value
+
+    def _set_cache(
+        self,
+        cache: Dict[str, Dict[str, Any]],
+        key: str,
+        value: Dict[str, Any],
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        tier = self._disk_tiers.get(id(cache))
+        if ttl is None:
+            ttl = tier[1] if tier else self.cache_ttl
+        with self._lock_for(cache):
+            cache[key] = {"value": value, "expires_at": time.time() + ttl}
+            if max_entries is not None:
+                cache.move_to_end(key)
+                while len(cache) > max_entries:
+                    cache.popitem(last=False)
+        if tier is not None:
+            try:
+                self._disk_cache.set(f"{tier[0]}:{key}", value, expire=ttl)
+            except Exception as e:
+                logger.debug(f"Disk cache write error for {key}: {str(e)}")
+
+    def _cache_result(
+        self, cache: Dict[str, Dict[str, Any]], key: str, result: Dict, ttl: Optional[float] = None
+    ) -> None:
+        """Cache a check result; skipped ones only for negative_cache_ttl"""
+        if result.get("skipped"):
+            ttl = self.negative_cache_ttl
+        self._set_cache(cache, key, result, ttl=ttl)
+
+    def _run_async(self, coro):
+        """Run a coroutine on the verifier's event loop and block until it finishes.
+        Safe to call from any thread, including one that already runs an event loop."""
+        return self._submit_async(coro).result()
 
-    def _set_cache(self, cache: Dict[str, Dict[str, Any]], key: str, value: Dict[str, Any]) -> None:
+    def _submit_async(self, coro) -> Future:
+        """Schedule a coroutine on the verifier's event loop without waiting for it"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def _is_circuit_open(self, mx_host: str) -> bool:
+        with self._mx_failure_lock:
+            open_until = self._mx_circuit_open_until.get(mx_host)
+            if open_until is None:
+                return False
+            if open_until > time.time():
+                return True
+            self._mx_circuit_open_until.pop(mx_host, None)
+            return False
+
+    def _record_mx_failure(self, mx_host: str) -> None:
+        now = time.time()
+        with self._mx_failure_lock:
+            count, first_failure = self._mx_failure_cache.get(mx_host, (0, now))
+            if now - first_failure > self.mx_failure_window:
+                count, first_failure = 0, now
+            count += 1
+            self._mx_failure_cache[mx_host] = (count, first_failure)
+            if count >= self.mx_failure_threshold:
+                self._mx_circuit_open_until[mx_host] = now + self.mx_circuit_cooldown
+                self._mx_failure_cache.pop(mx_host, None)
+
+    def _record_mx_success(self, mx_host: str) -> None:
+        with self._mx_failure_lock:
+            self._mx_failure_cache.pop(mx_host, None)
+
+    def _record_mx_latency(self, mx_host: str, seconds: float) -> None:
+        with self._mx_latency_lock:
+            self._mx_latency[mx_host].append(seconds)
+
+    def _adaptive_timeout(self, mx_host: str, hard_cap: float) -> float:
+        """2x the p95 of recent successful round trips to mx_host, capped at the
+        configured timeout; the configured timeout until enough samples exist"""
+        with self._mx_latency_lock:
+            samples = list(self._mx_latency.get(mx_host, ()))
+        if len(samples) < self.mx_latency_min_samples:
+            return hard_cap
+        p95 = statistics.quantiles(samples, n=20)[18]
+        return min(hard_cap, max(self.mx_timeout_floor, 2 * p95))
+
+    def _mx_slot(self, mx_host: str) -> threading.BoundedSemaphore:
+        slot = self._mx_slots.get(mx_host)
+        if slot is None:
+            slot = self._mx_slots.setdefault(mx_host, threading.BoundedSemaphore(self.smtp_max_sessions_per_mx))
+        return slot
+
+    def _take_mx_slot(self, mx_host: str) -> threading.BoundedSemaphore:
+        """Wait for a free connection slot to mx_host, closing idle pooled sessions
+        to it (they hold slots too) rather than waiting on them"""
+        slot = self._mx_slot(mx_host)
+        deadline = time.time() + self.smtp_slot_wait
+        while not slot.acquire(timeout=0.05):
+            with self._cache_lock:
+                idle = next((q for k, q in self._smtp_pool.items() if k[0] == mx_host and q), None)
+                server = idle.popleft() if idle else None
+            if server is not None:
+                # Close it here rather than queueing a QUIT: the slot is needed now
+                self._discard_smtp(server)
+            elif time.time() >= deadline:
+                raise SMTPSlotUnavailable(f"No free SMTP connection slot for {mx_host}")
+        return slot
+
+    def _check_circuit(self, mx_host: str) -> None:
+        if self._is_circuit_open(mx_host):
+            raise ConnectionError(f"Circuit open for {mx_host} after repeated connect failures")
+
+    def _open_smtp(
+        self,
+        mx_host: str,
+        timeout: float,
+        port: int = 25,
+        slot: Optional[threading.BoundedSemaphore] = None,
+    ) -> _PooledSMTP:
+        """Open a new SMTP connection (greeting read, no EHLO yet). Takes a per-MX
+        connection slot unless the caller already holds one; close() gives it back."""
+        if slot is None:
+            self._check_circuit(mx_host)
+            slot = self._take_mx_slot(mx_host)
+        server = _PooledSMTP(timeout=timeout)
+        server.mx_slot = slot
+        server.set_debuglevel(0)
+        server._host = mx_host  # STARTTLS sends it as SNI and checks the certificate against it
+        try:
+            started = time.monotonic()
+            server.greeting = server.connect(self._mx_address(mx_host), port)
+        except (OSError, smtplib.SMTPException):
+            server.close()
+            self._record_mx_failure(mx_host)
+            raise
+        server.handshake_time = time.monotonic() - started
+        self._record_mx_latency(mx_host, server.handshake_time)
+        self._record_mx_success(mx_host)
+        server.pool_expires_at = time.time() + self.smtp_pool_ttl
+        return server
+
+    def _get_smtp(self, mx_host: str, timeout: float = 5, port: int = 25) -> _PooledSMTP:
+        """Check out an EHLO'd SMTP session to mx_host, reusing an idle pooled one
+        when it still answers NOOP. Return it with _release_smtp when done."""
+        self._sweep_idle_smtp()
+        key = (mx_host, port)
+        slot = self._mx_slot(mx_host)
+        started = time.time()
+        deadline = started + self.smtp_slot_wait
+        while True:
+            server = self._pop_idle_smtp(key, timeout)
+            if server is not None:
+                # The NOOP liveness check counts as waiting, not as server latency
+                server.slot_wait = time.time() - started
+                server.pool_reused = True
+                return server
+            # No idle session: open one once a connection slot frees up, picking
+            # up any session another check hands back in the meantime
+            self._check_circuit(mx_host)
+            if slot.acquire(timeout=0.05):
+                break
+            if time.time() >= deadline:
+                raise SMTPSlotUnavailable(f"No free SMTP connection slot for {mx_host}")
+        
+        slot_wait = time.time() - started
+        server = self._open_smtp(mx_host, timeout, port, slot)
+        server.slot_wait = slot_wait
+        try:
+            code, _ = server.ehlo()
+            if code != 250:
+                server.helo()
+        except Exception:
+            self._discard_smtp(server)
+            raise
+        return server
+
+    def _pop_idle_smtp(self, key: Tuple[str, int], timeout: float) -> Optional[_PooledSMTP]:
+        """Take an idle pooled session that still answers NOOP, dropping stale ones"""
+        while True:
+            with self._cache_lock:
+                idle = self._smtp_pool.get(key)
+                server = idle.pop() if idle else None
+            if server is None:
+                return None
+            if server.pool_expires_at > time.time():
+                try:
+                    server.timeout = timeout
+                    server.sock.settimeout(timeout)
+                    if server.noop()[0] == 250:
+                        return server
+                except (smtplib.SMTPException, OSError):
+                    pass
+            self._discard_smtp(server)
+
+    def _release_smtp(self, mx_host: str, server: _PooledSMTP, port: int = 25) -> None:
+        """Reset the session and hand it back to the pool for the next check"""
+        server.pool_messages += 1
+        if server.pool_expires_at <= time.time() or server.pool_messages >= self.smtp_max_msgs_per_conn:
+            self._discard_smtp(server)
+            return
+        try:
+            server.rset()
+        except (smtplib.SMTPException, OSError):
+            self._discard_smtp(server)
+            return
         with self._cache_lock:
-            cache[key] = {"value": value, "expires_at": time.time() + self.cache_ttl}
+            self._smtp_pool.setdefault((mx_host, port), deque()).append(server)
+        self._sweep_idle_smtp()
+    
+    def _sweep_idle_smtp(self) -> None:
+        """Close idle pooled sessions past their TTL, whichever MX host they belong to"""
+        now = time.time()
+        if now - self._smtp_swept_at < self.smtp_sweep_interval:
+            return
+        expired: List[_PooledSMTP] = []
+        with self._cache_lock:
+            self._smtp_swept_at = now
+            for key, idle in list(self._smtp_pool.items()):
+                live = [server for server in idle if server.pool_expires_at > now]
+                if len(live) < len(idle):
+                    expired.extend(server for server in idle if server.pool_expires_at <= now)
+                    idle.clear()
+                    idle.extend(live)
+                if not idle:
+                    del self._smtp_pool[key]
+        for server in expired:
+            self._discard_smtp(server)
+
+    @contextmanager
+    def _acquire_smtp(self, mx_host: str, timeout: float = 5, port: int = 25):
+        """with-block form of _get_smtp/_release_smtp: the session goes back to the
+        pool when the block exits normally and is dropped if it raises"""
+        server = self._get_smtp(mx_host, timeout, port)
+        try:
+            yield server
+        except BaseException:
+            self._discard_smtp(server)
+            raise
+        self._release_smtp(mx_host, server, port)
+
+    @staticmethod
+    def _discard_smtp(server: Optional[smtplib.SMTP]) -> None:
+        if server is None:
+            return
+        try:
+            server.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _quit_smtp(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    def _close_smtp_pool(self, mx_hosts: Optional[List[str]] = None) -> None:
+        """QUIT idle pooled sessions (for the given MX hosts, or all of them)"""
+        with self._cache_lock:
+            keys = [k for k in self._smtp_pool if mx_hosts is None or k[0] in mx_hosts]
+            idle = [server for k in keys for server in self._smtp_pool.pop(k)]
+        for server in idle:
+            # Sign off in the background; nothing waits for the 221
+            self._quit_executor.submit(self._quit_smtp, server)
+
+    async def _race_resolve(self, qname, rdtype: str):
+        """Send the same query to every configured resolver and return the first answer.
+        NXDOMAIN and NoAnswer are answers too and end the race; only timeouts and
+        transport errors fall through to the slower resolvers."""
+        tasks = [asyncio.ensure_future(resolver.resolve(qname, rdtype)) for resolver in self._race_resolvers]
+        error: Optional[BaseException] = None
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    if isinstance(error, (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer)):
+                        raise error
+            raise error
+        finally:
+            self._cancel_tasks(tasks)
+
+    @staticmethod
+    def _cancel_tasks(tasks: List[asyncio.Future]) -> None:
+        """Cancel the losers of a race; failures that already landed are retrieved
+        so asyncio does not log them as never retrieved"""
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()
+
+    async def _resolve_a_async(self, host: str) -> str:
+        answer = await self._race_resolve(host, 'A')
+        return answer[0].address
+
+    def _resolve_mx_ip(self, mx_host: str) -> str:
+        """A record of an MX host. PTR, reputation and port checks all need it; the
+        shared answer cache turns the repeats into local lookups."""
+        return self._run_async(self._resolve_a_async(mx_host))
+
+    def _mx_address(self, mx_host: str) -> str:
+        """Address to connect to: from the shared resolver cache instead of a blocking,
+        uncached getaddrinfo per connection. Falls back to the host name (hosts file,
+        IPv6-only MX) when there is no A record."""
+        try:
+            return self._resolve_mx_ip(mx_host)
+        except dns.exception.DNSException:
+            return mx_host
+
+    async def _resolve_ptr_async(self, ip_address: str) -> str:
+        answer = await self._race_resolve(dns.reversename.from_address(ip_address), 'PTR')
+        return str(answer[0].target).rstrip('.')
         
     def verify_email(
         self,
@@ -101,6 +863,182 @@ class EmailVerifier:
         Main verification method
         Returns comprehensive verification result with point-based score (0-100)
         """
+        return self._verify_with_prefetched(email, None, fast_mode, confidence_mode, internet_checks)
+    
+    def verify_batch(
+        self,
+        emails: List[str],
+        fast_mode: bool = True,
+        confidence_mode: str = "balanced",
+        internet_checks: bool = True,
+        max_workers: int = 64,
+    ) -> List[Dict]:
+        """
+        Verify many emails at once, results in input order.
+        Domain-level checks run once per distinct domain and are shared by its emails.
+        """
+        by_domain: Dict[str, List[str]] = defaultdict(list)
+        for email in emails:
+            if self._check_syntax(email)["valid"]:
+                by_domain[email.lower().split('@', 1)[1]].append(email)
+        
+        def prefetch(domain: str) -> Dict[str, Dict]:
+            try:
+                return self._prefetch_domain(domain, fast_mode)
+            except Exception as e:
+                logger.debug(f"Domain prefetch error for {domain}: {str(e)}")
+                return {}
+        
+        def verify(email: str) -> Dict:
+            domain = email.lower().split('@', 1)[1] if '@' in email else ''
+            try:
+                return self._verify_with_prefetched(
+                    email, prefetched.get(domain), fast_mode, confidence_mode, internet_checks
+                )
+            except Exception as e:
+                return {"email": email, "status": "error", "score": 0, "confidence": 0.0, "reason": str(e)}
+        
+        # Workers wait on self._executor futures, so they need their own pool
+        prefetched: Dict[str, Dict[str, Dict]] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                prefetched = dict(zip(by_domain, executor.map(prefetch, by_domain)))
+                return list(executor.map(verify, emails))
+        finally:
+            # Sessions stay pooled across the batch's emails; sign off once it is done
+            mx_hosts = [mx for fetched in prefetched.values() for mx in fetched.get("dns_health", {}).get("mx_hosts", [])]
+            self._close_smtp_pool(mx_hosts)
+    
+    def close(self) -> None:
+        """Sign off every idle pooled SMTP session (call on shutdown)"""
+        self._close_smtp_pool()
+    
+    def _prefetch_domain(self, domain: str, fast_mode: bool = True) -> Dict[str, Dict]:
+        """Run the checks that depend only on the domain and its primary MX"""
+        dns_result = self._check_dns_health(domain, fast_mode)
+        prefetched = {"dns_health": dns_result}
+        if not dns_result["domain_exists"]:
+            return prefetched
+        mx_hosts = dns_result.get("mx_hosts", [])
+        futures = self._submit_domain_checks(domain, mx_hosts[0] if mx_hosts else None, fast_mode=fast_mode)
+        # The SMTP connection test and role-account probe only depend on the domain
+        # too, so they run once here and every email goes straight to its RCPT
+        if not self._provider_blocks_rcpt(domain):
+            smtp_connection = self._check_smtp_connection(domain, mx_hosts, fast_mode)
+            futures["smtp_connection"] = self._completed(smtp_connection)
+            if not fast_mode:
+                if smtp_connection.get("port_25_open"):
+                    futures["role_accounts"] = self._executor.submit(self._check_role_accounts, domain, mx_hosts)
+                else:
+                    futures["role_accounts"] = self._completed(self._unmet_precondition("smtp_ok"))
+                futures.update(self._submit_mx_followups(domain, mx_hosts, smtp_connection, fast_mode))
+        for name, future in futures.items():
+            prefetched[name] = future.result()
+        return prefetched
+    
+    @staticmethod
+    def _await_check(future: Future, deadline: float) -> Dict:
+        """Result of a dispatched check, or a zero-point placeholder once the deadline has passed"""
+        try:
+            return future.result(timeout=max(0.0, deadline - time.time()))
+        except FutureTimeoutError:
+            future.cancel()
+            return {"points": 0, "skipped": True, "timed_out": True}
+    
+    @staticmethod
+    def _unmet_precondition(precondition: str) -> Dict:
+        """Zero-point stand-in for a check skipped because an earlier one failed"""
+        return {"points": 0, "skipped": True, "reason": f"precondition_failed:{precondition}"}
+    
+    @staticmethod
+    def _completed(value: Any) -> Future:
+        future: Future = Future()
+        future.set_result(value)
+        return future
+    
+    def _submit_domain_checks(
+        self,
+        domain: str,
+        primary_mx: Optional[str],
+        prefetched: Optional[Dict[str, Dict]] = None,
+        fast_mode: bool = False,
+    ) -> Dict[str, Future]:
+        """Dispatch the domain- and MX-level checks, reusing prefetched results where present"""
+        prefetched = prefetched or {}
+        
+        def submit(name: str, fn, *args) -> Future:
+            if name in prefetched:
+                return self._completed(prefetched[name])
+            return self._executor.submit(fn, *args)
+        
+        futures = {
+            "domain_age": submit("domain_age", self._check_domain_age, domain),
+            "security_reputation": submit("security_reputation", self._check_security_reputation, domain, fast_mode),
+            "web_presence": submit("web_presence", self._check_web_presence, domain),
+            "dnssec": submit("dnssec", self._check_dnssec, domain),
+            "domain_blacklists": submit("domain_blacklists", self._check_domain_blacklists, domain),
+        }
+        if primary_mx:
+            futures["ptr_record"] = submit("ptr_record", self._check_ptr_record, primary_mx)
+            futures["ip_reputation"] = submit("ip_reputation", self._check_ip_reputation, primary_mx)
+            futures["mx_popularity"] = submit("mx_popularity", self._check_mx_popularity, primary_mx)
+            futures["mx_consistency"] = submit("mx_consistency", self._check_mx_consistency, primary_mx, domain)
+            futures["mx_brand"] = submit("mx_brand", self._check_mx_brand, primary_mx)
+        return futures
+    
+    def _submit_mx_followups(
+        self,
+        domain: str,
+        mx_hosts: List[str],
+        smtp_connection: Dict,
+        fast_mode: bool,
+        prefetched: Optional[Dict[str, Dict]] = None,
+    ) -> Dict[str, Future]:
+        """Dispatch the full-mode checks that need the SMTP connection outcome but
+        not the address, reusing prefetched results where present"""
+        prefetched = prefetched or {}
+        
+        def submit(name: str, fn, *args) -> Future:
+            if name in prefetched:
+                return self._completed(prefetched[name])
+            return self._executor.submit(fn, *args)
+        
+        if smtp_connection.get("provider_blocked") or smtp_connection.get("port_25_open"):
+            futures = {
+                "provider_fingerprint": submit(
+                    "provider_fingerprint", self._check_provider_fingerprint, domain, mx_hosts, smtp_connection, fast_mode
+                ),
+            }
+        else:
+            futures = {"provider_fingerprint": self._completed(self._unmet_precondition("smtp_ok"))}
+        if smtp_connection.get("provider_blocked"):
+            return futures
+        if mx_hosts:
+            futures["mail_ports"] = submit("mail_ports", self._check_mail_ports, mx_hosts[0])
+        mx_used = smtp_connection.get("mx_used")
+        if mx_used:
+            futures["tls_policy"] = submit("tls_policy", self._check_tls_policy_strength, mx_used)
+            futures["mailfrom_health"] = submit("mailfrom_health", self._check_mailfrom_health, domain, mx_hosts, smtp_connection)
+            futures["quit_behavior"] = submit("quit_behavior", self._check_quit_behavior, mx_used)
+            futures["tcp_stability"] = submit("tcp_stability", self._check_tcp_stability, mx_used)
+        return futures
+    
+    def _verify_with_prefetched(
+        self,
+        email: str,
+        prefetched: Optional[Dict[str, Dict]],
+        fast_mode: bool = True,
+        confidence_mode: str = "balanced",
+        internet_checks: bool = True,
+    ) -> Dict:
+        """verify_email, skipping the sub-checks already present in prefetched"""
+        prefetched = prefetched or {}
+        run_internet_checks = internet_checks or self.enable_internet_checks
+        result_cache_key = f"{email.lower()}|{fast_mode}|{confidence_mode}|{run_internet_checks}"
+        cached_result = self._get_cached(self._result_cache, result_cache_key)
+        if cached_result:
+            return copy.deepcopy(cached_result)
+        
         score = 0
         score_details = {}
         
@@ -131,7 +1069,7 @@ class EmailVerifier:
         }
         
         # 2. Domain Existence & DNS Health
-        dns_result = self._check_dns_health(domain)
+        dns_result = prefetched.get("dns_health") or self._check_dns_health(domain, fast_mode)
         score += dns_result["points"]
         score_details["dns_health"] = dns_result
         
@@ -143,14 +1081,86 @@ class EmailVerifier:
             return result
         
         mx_hosts = dns_result.get("mx_hosts", [])
+        primary_mx = mx_hosts[0] if mx_hosts else None
+        
+        # Providers that always block SMTP verification are scored from DNS and
+        # domain signals only; PLBR caps the score without an RCPT result anyway
+        provider_blocked = self._provider_blocks_rcpt(domain.lower())
+        
+        # Every check below is network-bound. The ones that do not depend on the
+        # SMTP dialogue are dispatched now and run while the SMTP test is in flight;
+        # results are still folded into the score in the original order because
+        # the hard-failure and provider caps depend on it.
+        futures = self._submit_domain_checks(domain, primary_mx, prefetched, fast_mode)
+        deadline = time.time() + self.checks_deadline
+        submit = self._executor.submit
+        if run_internet_checks:
+            futures["internet_check"] = submit(
+                internet_check_module.check_internet_presence,
+                email,
+                enable_hibp=self.hibp_enabled,
+            )
+        
+        # 4. SMTP Connection Test
+        if provider_blocked:
+            smtp_connection = {
+                "port_25_open": False,
+                "tls_successful": False,
+                "greeting": {},
+                "points": 0,
+                "mx_used": None,
+                "skipped": True,
+                "provider_blocked": True,
+            }
+        else:
+            smtp_connection = prefetched.get("smtp_connection") or self._check_smtp_connection(domain, mx_hosts, fast_mode)
+        
+        # Probes that talk to the MX are only started once port 25 is known to answer;
+        # otherwise each would sit out its own connect timeout to report nothing
+        smtp_ok = bool(smtp_connection.get("port_25_open"))
+        if not fast_mode and not provider_blocked:
+            if len(mx_hosts) > 1:
+                futures["loadbalancer"] = (
+                    submit(self._check_loadbalancer_behavior, email, domain, mx_hosts)
+                    if smtp_ok else self._completed(self._unmet_precondition("smtp_ok"))
+                )
+            if "role_accounts" in prefetched:
+                futures["role_accounts"] = self._completed(prefetched["role_accounts"])
+            elif smtp_ok:
+                futures["role_accounts"] = submit(self._check_role_accounts, domain, mx_hosts)
+            else:
+                futures["role_accounts"] = self._completed(self._unmet_precondition("smtp_ok"))
+        
+        # 6. SMTP RCPT TO / Verification Response
+        # In full mode the catch-all probe rides along in the same SMTP transaction
+        catch_all_email = None
+        if not fast_mode and not provider_blocked:
+            catch_all_email = self._random_catch_all_email(domain)
+        smtp_rcpt = self._check_smtp_rcpt(email, domain, mx_hosts, smtp_connection, fast_mode, catch_all_email)
+        
+        # Checks that need the SMTP outcome are chained after it
+        mx_used = smtp_connection.get("mx_used")
+        if mx_used:
+            futures["tls_certificate"] = submit(self._check_tls_certificate, mx_used)
+        if not fast_mode:
+            futures.update(self._submit_mx_followups(domain, mx_hosts, smtp_connection, fast_mode, prefetched))
+            if self._is_greylisted(smtp_rcpt):
+                # These mostly wait between attempts, so they run on the event loop
+                futures["smtp_retry"] = self._submit_async(
+                    self._smtp_retry_simulation_async(email, domain, mx_hosts, smtp_rcpt)
+                )
+                futures["greylist_depth"] = self._submit_async(
+                    self._check_greylist_depth_async(email, domain, mx_hosts, smtp_rcpt)
+                )
+            if mx_used:
+                futures["vrfy_lite"] = submit(self._check_vrfy_lite_behavior, email, domain, mx_hosts, smtp_connection)
         
         # 3. Domain Age & Reputation
-        age_result = self._check_domain_age(domain)
+        age_result = self._await_check(futures["domain_age"], deadline)
         score += age_result["points"]
         score_details["domain_age"] = age_result
         
         # 4. SMTP Connection Test
-        smtp_connection = self._check_smtp_connection(domain, mx_hosts, fast_mode)
         score += smtp_connection["points"]
         score_details["smtp_connection"] = smtp_connection
         
@@ -160,7 +1170,6 @@ class EmailVerifier:
         score_details["smtp_greeting"] = greeting_result
         
         # 6. SMTP RCPT TO / Verification Response
-        smtp_rcpt = self._check_smtp_rcpt(email, domain, mx_hosts, smtp_connection, fast_mode)
         score += smtp_rcpt["points"]
         score_details["smtp_rcpt"] = smtp_rcpt
         
@@ -174,19 +1183,19 @@ class EmailVerifier:
         score_details["smtp_timing"] = timing_result
         
         # 8. Domain Security Reputation Signals
-        security_result = self._check_security_reputation(domain)
+        security_result = self._await_check(futures["security_reputation"], deadline)
         score += security_result["points"]
         score_details["security_reputation"] = security_result
         
         # 9. Web Presence Check (Domain-Level Only)
-        web_result = self._check_web_presence(domain)
+        web_result = self._await_check(futures["web_presence"], deadline)
         score += web_result["points"]
         score_details["web_presence"] = web_result
         
         # Advanced Features (10-21)
         # 10. Mailbox Provider Fingerprinting (MPF)
-        if not fast_mode:
-            mpf_result = self._check_provider_fingerprint(domain, mx_hosts, smtp_connection, fast_mode)
+        if "provider_fingerprint" in futures:
+            mpf_result = self._await_check(futures["provider_fingerprint"], deadline)
             score += mpf_result["points"]
             score_details["provider_fingerprint"] = mpf_result
         
@@ -202,50 +1211,50 @@ class EmailVerifier:
         score_details["provider_rules"] = plbr_result
         
         # 13. SMTP Retry Simulation (for greylisting)
-        if not fast_mode and smtp_rcpt.get("soft_failure"):
-            retry_result = self._smtp_retry_simulation(email, domain, mx_hosts)
+        if "smtp_retry" in futures:
+            retry_result = self._await_check(futures["smtp_retry"], deadline)
             if retry_result.get("success_after_retry"):
                 score += 20  # +20 for strong confirmation
             score_details["smtp_retry"] = retry_result
         
         # 14. TLS Certificate Intelligence (TCI)
-        if smtp_connection.get("mx_used"):
-            tci_result = self._check_tls_certificate(smtp_connection["mx_used"])
+        if "tls_certificate" in futures:
+            tci_result = self._await_check(futures["tls_certificate"], deadline)
             score += tci_result["points"]
             score_details["tls_certificate"] = tci_result
         
         # 15. Open Ports Scan (Mail Infra Health)
-        if not fast_mode and mx_hosts:
-            ports_result = self._check_mail_ports(mx_hosts[0])
+        if "mail_ports" in futures:
+            ports_result = self._await_check(futures["mail_ports"], deadline)
             score += ports_result["points"]
             score_details["mail_ports"] = ports_result
         
         # 16. DNSSEC Check
-        dnssec_result = self._check_dnssec(domain)
+        dnssec_result = self._await_check(futures["dnssec"], deadline)
         score += dnssec_result["points"]
         score_details["dnssec"] = dnssec_result
         
         # 17. PTR Record Verification
-        if mx_hosts:
-            ptr_result = self._check_ptr_record(mx_hosts[0])
+        if "ptr_record" in futures:
+            ptr_result = self._await_check(futures["ptr_record"], deadline)
             score += ptr_result["points"]
             score_details["ptr_record"] = ptr_result
         
         # 18. IP Reputation Score
-        if mx_hosts:
-            ip_reputation_result = self._check_ip_reputation(mx_hosts[0])
+        if "ip_reputation" in futures:
+            ip_reputation_result = self._await_check(futures["ip_reputation"], deadline)
             score += ip_reputation_result["points"]
             score_details["ip_reputation"] = ip_reputation_result
         
         # 19. Mail Server Behaviour Analysis (Heuristics)
-        if smtp_connection.get("mx_used"):
+        if mx_used:
             behavior_result = self._analyze_server_behavior(smtp_connection, smtp_rcpt)
             score += behavior_result["points"]
             score_details["server_behavior"] = behavior_result
         
         # 20. Free Reverse MX Lookup (Global Domain Popularity)
-        if mx_hosts:
-            mx_popularity_result = self._check_mx_popularity(mx_hosts[0])
+        if "mx_popularity" in futures:
+            mx_popularity_result = self._await_check(futures["mx_popularity"], deadline)
             score += mx_popularity_result["points"]
             score_details["mx_popularity"] = mx_popularity_result
         
@@ -256,14 +1265,14 @@ class EmailVerifier:
         
         # Additional Advanced Features (22-27)
         # 22. Mail Exchanger Consistency Check (MX↔A sanity test)
-        if mx_hosts:
-            mx_consistency_result = self._check_mx_consistency(mx_hosts[0], domain)
+        if "mx_consistency" in futures:
+            mx_consistency_result = self._await_check(futures["mx_consistency"], deadline)
             score += mx_consistency_result["points"]
             score_details["mx_consistency"] = mx_consistency_result
         
         # 23. STARTTLS Upgrade Behaviour (TLS Policy Strength)
-        if smtp_connection.get("mx_used") and not fast_mode:
-            tls_policy_result = self._check_tls_policy_strength(smtp_connection["mx_used"])
+        if "tls_policy" in futures:
+            tls_policy_result = self._await_check(futures["tls_policy"], deadline)
             score += tls_policy_result["points"]
             score_details["tls_policy"] = tls_policy_result
         
@@ -273,50 +1282,50 @@ class EmailVerifier:
         score_details["mx_redundancy"] = mx_redundancy_result
         
         # 25. SMTP Transaction Strictness Scoring
-        if smtp_connection.get("mx_used") and not fast_mode:
+        if mx_used and not fast_mode:
             strictness_result = self._check_smtp_strictness(smtp_connection, smtp_rcpt)
             score += strictness_result["points"]
             score_details["smtp_strictness"] = strictness_result
         
         # 26. MAIL FROM Domain Health
-        if smtp_connection.get("mx_used") and not fast_mode:
-            mailfrom_result = self._check_mailfrom_health(domain, mx_hosts, smtp_connection)
+        if "mailfrom_health" in futures:
+            mailfrom_result = self._await_check(futures["mailfrom_health"], deadline)
             score += mailfrom_result["points"]
             score_details["mailfrom_health"] = mailfrom_result
         
         # 27. Connection Latency Fingerprinting
-        if smtp_connection.get("mx_used") and not fast_mode:
+        if mx_used and not fast_mode:
             latency_result = self._analyze_connection_latency(smtp_connection, smtp_rcpt)
             score += latency_result["points"]
             score_details["latency_fingerprint"] = latency_result
         
         # 28. SMTP Load-Balancer Behavior
-        if len(mx_hosts) > 1 and not fast_mode:
-            loadbalancer_result = self._check_loadbalancer_behavior(email, domain, mx_hosts)
+        if "loadbalancer" in futures:
+            loadbalancer_result = self._await_check(futures["loadbalancer"], deadline)
             score += loadbalancer_result["points"]
             score_details["loadbalancer"] = loadbalancer_result
         
         # 29. SMTP "VRFY Lite" Behaviour
-        if smtp_connection.get("mx_used") and not fast_mode:
-            vrfy_result = self._check_vrfy_lite_behavior(email, domain, mx_hosts, smtp_connection)
+        if "vrfy_lite" in futures:
+            vrfy_result = self._await_check(futures["vrfy_lite"], deadline)
             score += vrfy_result["points"]
             score_details["vrfy_lite"] = vrfy_result
         
         # 30. Recipient Domain Email Role Account Policy
-        if not fast_mode:
-            role_account_result = self._check_role_accounts(domain, mx_hosts)
+        if "role_accounts" in futures:
+            role_account_result = self._await_check(futures["role_accounts"], deadline)
             score += role_account_result["points"]
             score_details["role_accounts"] = role_account_result
         
         # 31. MX Infrastructure Identity Check (Brand MX Mapping)
-        if mx_hosts:
-            brand_mx_result = self._check_mx_brand(mx_hosts[0])
+        if "mx_brand" in futures:
+            brand_mx_result = self._await_check(futures["mx_brand"], deadline)
             score += brand_mx_result["points"]
             score_details["mx_brand"] = brand_mx_result
         
         # 32. Greylist "Depth Check"
-        if smtp_rcpt.get("soft_failure") and not fast_mode:
-            greylist_depth_result = self._check_greylist_depth(email, domain, mx_hosts)
+        if "greylist_depth" in futures:
+            greylist_depth_result = self._await_check(futures["greylist_depth"], deadline)
             score += greylist_depth_result["points"]
             score_details["greylist_depth"] = greylist_depth_result
         
@@ -327,63 +1336,50 @@ class EmailVerifier:
             score_details["smtp_banner"] = banner_result
         
         # 34. Spamhaus DBL / Barracuda BL DNS Lookup
-        dbl_result = self._check_domain_blacklists(domain)
+        dbl_result = self._await_check(futures["domain_blacklists"], deadline)
         score += dbl_result["points"]
         score_details["domain_blacklists"] = dbl_result
         
         # 35. SMTP QUIT Acknowledgement Behavior
-        if smtp_connection.get("mx_used") and not fast_mode:
-            quit_result = self._check_quit_behavior(smtp_connection["mx_used"])
+        if "quit_behavior" in futures:
+            quit_result = self._await_check(futures["quit_behavior"], deadline)
             score += quit_result["points"]
             score_details["quit_behavior"] = quit_result
         
         # 36. TCP Retransmissions Patterns (VERY ADVANCED)
         # Note: This requires low-level socket monitoring, skipped in fast mode
-        if smtp_connection.get("mx_used") and not fast_mode:
-            tcp_stability_result = self._check_tcp_stability(smtp_connection["mx_used"])
+        if "tcp_stability" in futures:
+            tcp_stability_result = self._await_check(futures["tcp_stability"], deadline)
             score += tcp_stability_result.get("points", 0)
             score_details["tcp_stability"] = tcp_stability_result
         
         # Catch-all detection
-        catch_all_result = self._detect_catch_all(domain, mx_hosts) if not fast_mode else {"is_catchall": False, "skipped": True}
+        catch_all_result = {"is_catchall": False, "skipped": True}
+        if catch_all_email:
+            catch_all_result = {
+                "is_catchall": smtp_rcpt["catch_all_detected"],
+                "test_email": catch_all_email,
+                "skipped": "catch_all_code" not in smtp_rcpt,
+            }
         score_details["catch_all"] = catch_all_result
         if catch_all_result.get("is_catchall"):
             score += 10  # +10 for catch-all (but mark as risky)
             result["risky"] = True
         
         # Internet presence checks (optional)
-        if internet_checks or self.enable_internet_checks:
+        if "internet_check" in futures:
             try:
-                result["details"]["internet_check"] = internet_check_module.check_internet_presence(
-                    email,
-                    enable_hibp=self.hibp_enabled,
-                )
+                score_details["internet_check"] = futures["internet_check"].result(timeout=max(0.0, deadline - time.time()))
             except Exception as e:
-                result["details"]["internet_check"] = {"error": str(e)}
+                score_details["internet_check"] = {"error": str(e)}
         
-        # Ensure score is between 0 and 100
-        score = max(0, min(100, score))
+        # Ensure score is between 0 and 100 and determine status based on it
+        score, status_index = _finalize_score(int(score))
         
         result["score"] = score
         result["confidence"] = score / 100.0
         result["details"] = score_details
-        
-        # Determine status based on score
-        if score >= 90:
-            result["status"] = "valid"
-            result["reason"] = "Very likely valid"
-        elif score >= 70:
-            result["status"] = "likely_valid"
-            result["reason"] = "Probably valid but unconfirmed"
-        elif score >= 50:
-            result["status"] = "uncertain"
-            result["reason"] = "Uncertain (common when SMTP blocks verification)"
-        elif score >= 20:
-            result["status"] = "likely_invalid"
-            result["reason"] = "Likely invalid"
-        else:
-            result["status"] = "invalid"
-            result["reason"] = "Definitely invalid"
+        result["status"], result["reason"] = _STATUSES[status_index]
         
         # Apply optional per-domain overrides
         override = DOMAIN_CONFIDENCE_OVERRIDES.get(domain)
@@ -396,13 +1392,12 @@ class EmailVerifier:
             if isinstance(force_status, str):
                 result["status"] = force_status
 
+        self._set_cache(self._result_cache, result_cache_key, copy.deepcopy(result), max_entries=self.result_cache_max)
         return result
     
     def _check_syntax(self, email: str) -> Dict:
         """1. Basic Syntax Validation: Valid syntax → +10, Invalid → 0"""
-        # RFC 5322 compliant regex (simplified but effective)
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        valid = bool(re.match(pattern, email))
+        valid = bool(_EMAIL_SYNTAX_RE.match(email))
         
         return {
             "valid": valid,
@@ -410,8 +1405,29 @@ class EmailVerifier:
             "reason": "Valid syntax" if valid else "Invalid syntax"
         }
     
-    def _check_dns_health(self, domain: str) -> Dict:
+    def _check_dns_health(self, domain: str, fast_mode: bool = False) -> Dict:
         """2. Domain Existence & DNS Health"""
+        return self._run_async(self._check_dns_health_async(domain, fast_mode))
+    
+    async def _probe_dkim_async(self, domain: str) -> bool:
+        """Query the common DKIM selectors concurrently; the first hit cancels the rest"""
+        common_selectors = ['default', 'google', 'selector1', 'selector2', 'k1', 'mail']
+        tasks = [
+            asyncio.ensure_future(self._race_resolve(f"{selector}._domainkey.{domain}", 'TXT'))
+            for selector in common_selectors
+        ]
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any(task.exception() is None for task in done):
+                    return True
+            return False
+        finally:
+            self._cancel_tasks(tasks)
+    
+    async def _check_dns_health_async(self, domain: str, fast_mode: bool = False) -> Dict:
+        """2. Domain Existence & DNS Health (all queries issued concurrently, DKIM skipped in fast mode)"""
         points = 0
         result = {
             "domain_exists": False,
@@ -425,74 +1441,75 @@ class EmailVerifier:
         }
         
         start_time = time.time()
-        resolver = dns.resolver.Resolver()
-        resolver.timeout = 2.0
-        resolver.lifetime = 4.0
+        resolve = self._race_resolve
+        
+        async def no_dkim_probe() -> bool:
+            return False
         
         try:
+            a_answer, mx_answer, txt_answer, dmarc_answer, dkim_found = await asyncio.gather(
+                resolve(domain, 'A'),
+                resolve(domain, 'MX'),
+                resolve(domain, 'TXT'),
+                resolve(f"_dmarc.{domain}", 'TXT'),
+                no_dkim_probe() if fast_mode else self._probe_dkim_async(domain),
+                return_exceptions=True,
+            )
+            deliverability = {
+                "spf": False,
+                "dkim": dkim_found is True,
+                "dmarc": False,
+                "spf_record": None,
+                "dmarc_record": None,
+                "dkim_checked": not fast_mode,
+            }
+            
             # Check if domain exists (A record)
-            try:
-                resolver.resolve(domain, 'A')
+            if not isinstance(a_answer, BaseException):
                 result["domain_exists"] = True
-            except:
-                pass
             
             # Check MX records
-            try:
-                mx_records = resolver.resolve(domain, 'MX')
+            if not isinstance(mx_answer, BaseException):
                 mx_hosts = []
-                for mx in mx_records:
+                for mx in sorted(mx_answer, key=lambda r: r.preference):
                     mx_hosts.append(str(mx.exchange).rstrip('.'))
                 result["mx_hosts"] = mx_hosts
                 result["mx_present"] = True
                 points += 20  # MX present → +20
-            except dns.resolver.NoAnswer:
-                # Try A record as fallback
-                try:
-                    resolver.resolve(domain, 'A')
-                    result["domain_exists"] = True
-                    result["mx_hosts"] = [domain]
-                except:
-                    pass
-            except:
-                pass
+            elif isinstance(mx_answer, dns.resolver.NoAnswer) and result["domain_exists"]:
+                # Fall back to the A record as implicit MX
+                result["mx_hosts"] = [domain]
             
-            # Check SPF
-            try:
-                txt_records = resolver.resolve(domain, 'TXT')
-                for record in txt_records:
+            # Check SPF (the same TXT RRset also seeds the deliverability cache)
+            if not isinstance(txt_answer, BaseException):
+                for record in txt_answer:
                     txt_string = b''.join(record.strings).decode('utf-8', errors='ignore')
                     if txt_string.startswith('v=spf1'):
-                        result["spf_exists"] = True
-                        points += 5  # SPF exists → +5
-                        break
-            except:
-                pass
+                        deliverability["spf"] = True
+                        deliverability["spf_record"] = txt_string
+                if deliverability["spf"]:
+                    result["spf_exists"] = True
+                    points += 5  # SPF exists → +5
             
             # Check DMARC
-            try:
-                dmarc_domain = f"_dmarc.{domain}"
-                txt_records = resolver.resolve(dmarc_domain, 'TXT')
-                for record in txt_records:
+            if not isinstance(dmarc_answer, BaseException):
+                for record in dmarc_answer:
                     txt_string = b''.join(record.strings).decode('utf-8', errors='ignore')
                     if txt_string.startswith('v=DMARC1'):
-                        result["dmarc_exists"] = True
-                        points += 5  # DMARC exists → +5
-                        break
-            except:
-                pass
+                        deliverability["dmarc"] = True
+                        deliverability["dmarc_record"] = txt_string
+                if deliverability["dmarc"]:
+                    result["dmarc_exists"] = True
+                    points += 5  # DMARC exists → +5
             
-            # Check DKIM (common selectors)
-            common_selectors = ['default', 'google', 'selector1', 'selector2', 'k1', 'mail']
-            for selector in common_selectors:
-                try:
-                    dkim_domain = f"{selector}._domainkey.{domain}"
-                    resolver.resolve(dkim_domain, 'TXT')
-                    result["dkim_exists"] = True
-                    points += 5  # DKIM exists → +5
-                    break
-                except:
-                    continue
+            # Check DKIM (common selectors, full mode only)
+            if deliverability["dkim"]:
+                result["dkim_exists"] = True
+                points += 5  # DKIM exists → +5
+            
+            # A fast-mode answer (no DKIM probe) must not replace a full one
+            if not fast_mode or not self._get_cached(self._deliverability_cache, domain):
+                self._set_cache(self._deliverability_cache, domain, deliverability)
             
             # Measure DNS response time
             dns_time = (time.time() - start_time) * 1000  # Convert to ms
@@ -503,8 +1520,6 @@ class EmailVerifier:
             elif dns_time > 800:
                 points -= 3  # Slow (>800 ms) → -3
             
-        except dns.resolver.NXDOMAIN:
-            result["domain_exists"] = False
         except Exception as e:
             logger.warning(f"DNS check error for {domain}: {str(e)}")
         
@@ -542,14 +1557,13 @@ class EmailVerifier:
                     
                     if isinstance(creation_date, str):
                         # Try to parse string date
-                        try:
-                            from dateutil import parser
-                            creation_date = parser.parse(creation_date)
-                        except ImportError:
+                        if _dtparser is not None:
+                            creation_date = _dtparser.parse(creation_date)
+                        else:
                             # Fallback to datetime parsing
                             try:
                                 creation_date = datetime.fromisoformat(creation_date.replace('Z', '+00:00'))
-                            except:
+                            except ValueError:
                                 result["skipped"] = True
                                 result["points"] = 0
                                 self._set_cache(self._domain_age_cache, domain, result)
@@ -599,113 +1613,164 @@ class EmailVerifier:
         
         # Skip for known blocked domains
         domain_lower = domain.lower()
-        for blocked in self.smtp_blocked_domains:
-            if blocked in domain_lower or domain_lower.endswith('.' + blocked):
-                result["skipped"] = True
-                return result
+        if domain_lower in self._blocked_domain_set or self._blocked_suffix_re.search(domain_lower):
+            result["skipped"] = True
+            return result
         
         # Skip for transactional email services
-        transactional_patterns = [
-            'inbound-smtp', 'amazonaws.com', 'sendgrid.net',
-            'mailgun.org', 'mailgun.com', 'sparkpostmail.com',
-            'postmarkapp.com', 'mandrillapp.com',
-        ]
         for mx_host in mx_hosts[:2]:
-            mx_lower = mx_host.lower()
-            for pattern in transactional_patterns:
-                if pattern in mx_lower:
-                    result["skipped"] = True
-                    return result
+            if _TRANSACTIONAL_MX_RE.search(mx_host.lower()):
+                result["skipped"] = True
+                return result
         
         # Use faster timeout in fast mode
         smtp_timeout = self.fast_smtp_timeout if fast_mode else self.smtp_timeout
         port_timeout = 2 if fast_mode else 5
         
-        for mx_host in mx_hosts[:2]:
-            try:
-                # Test port 25 availability
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(port_timeout)
-                port_open = sock.connect_ex((mx_host, 25)) == 0
-                sock.close()
-                
-                if not port_open:
-                    continue
-                
-                result["port_25_open"] = True
-                result["points"] += 10  # Port 25 open → +10
-                result["mx_used"] = mx_host
-                
-                # Connect and check greeting
-                server = smtplib.SMTP(timeout=smtp_timeout)
-                server.set_debuglevel(0)
-                
+        # Probe MX hosts one at a time in preference order, starting with the one
+        # that worked last time, and stop at the first with an open port 25
+        working_mx = self._working_mx(domain, mx_hosts)
+        ordered = [working_mx] + [mx_host for mx_host in mx_hosts if mx_host != working_mx]
+        candidates = [mx_host for mx_host in ordered if not self._is_circuit_open(mx_host)]
+        if not candidates:
+            result["skipped"] = True
+            result["circuit_open"] = True
+            return result
+        for mx_host in candidates[:self.smtp_max_mx_probes]:
+            # Timeouts scale with how fast this MX has answered lately
+            probe = self._probe_mx(
+                mx_host,
+                self._adaptive_timeout(mx_host, smtp_timeout),
+                self._adaptive_timeout(mx_host, port_timeout),
+                fast_mode,
+            )
+            if probe["port_25_open"]:
+                result.update(probe)
+                self._set_cache(self._working_mx_cache, domain_lower, {"mx_host": mx_host}, ttl=self.working_mx_ttl)
+                break
+            if probe.get("skipped"):
+                # Our own connection cap, not a dead MX: score the test as skipped
+                result.update(probe)
+                break
+        else:
+            with self._lock_for(self._working_mx_cache):
+                self._working_mx_cache.pop(domain_lower, None)
+        
+        return result
+    
+    def _working_mx(self, domain: str, mx_hosts: List[str]) -> Optional[str]:
+        """MX host to talk to for domain: the cached first-live one if it is still
+        published, otherwise the most preferred"""
+        cached = self._get_cached(self._working_mx_cache, domain.lower())
+        if cached and cached["mx_host"] in mx_hosts:
+            return cached["mx_host"]
+        return mx_hosts[0] if mx_hosts else None
+    
+    def _probe_mx(self, mx_host: str, smtp_timeout: float, port_timeout: float, fast_mode: bool = True) -> Dict:
+        """Port 25, greeting and TLS probe against a single MX host"""
+        result = {
+            "port_25_open": False,
+            "tls_successful": False,
+            "greeting": {},
+            "points": 0,
+            "mx_used": None
+        }
+        
+        try:
+            # One connection serves as port probe, greeting read and SMTP session
+            server = self._open_smtp(mx_host, port_timeout)
+        except SMTPSlotUnavailable:
+            result["skipped"] = True
+            result["reason"] = "mx_slot_unavailable"
+            return result
+        except Exception as e:
+            logger.debug(f"Port check error for {mx_host}: {str(e)}")
+            return result
+        
+        result["port_25_open"] = True
+        result["points"] += 10  # Port 25 open → +10
+        result["mx_used"] = mx_host
+        
+        # Parse greeting (format: "220 hostname message")
+        greeting_code, greeting_msg = server.greeting
+        if greeting_code == 220:
+            result["greeting"]["valid"] = True
+            result["greeting"]["points"] = 10  # Valid 220 greeting → +10
+        else:
+            result["greeting"]["valid"] = False
+            result["greeting"]["points"] = -10  # Suspicious/no greeting → -10
+        result["greeting"]["code"] = greeting_code
+        result["greeting"]["message"] = f"{greeting_code} {greeting_msg.decode('utf-8', errors='ignore')}".strip()
+        
+        tls_broken = False
+        try:
+            server.timeout = smtp_timeout
+            server.sock.settimeout(smtp_timeout)
+        
+            # Try TLS handshake (skip in fast mode to save time)
+            if not fast_mode:
                 try:
-                    # Connect and check greeting using raw socket first
-                    greeting_code = None
-                    greeting_msg = ""
-                    try:
-                        # Use raw socket to read greeting
-                        raw_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                        raw_sock.settimeout(5)
-                        raw_sock.connect((mx_host, 25))
-                        greeting_response = raw_sock.recv(1024).decode('utf-8', errors='ignore').strip()
-                        raw_sock.close()
-                        
-                        # Parse greeting (format: "220 hostname message")
-                        if greeting_response.startswith('220'):
-                            greeting_code = 220
-                            greeting_msg = greeting_response
-                            result["greeting"]["valid"] = True
-                            result["greeting"]["points"] = 10  # Valid 220 greeting → +10
-                        else:
-                            result["greeting"]["valid"] = False
-                            result["greeting"]["points"] = -10  # Suspicious/no greeting → -10
-                    except Exception as e:
-                        # If raw socket fails, try smtplib and assume greeting is OK if connection succeeds
-                        logger.debug(f"Raw socket greeting check failed: {str(e)}")
-                        result["greeting"]["valid"] = False
-                        result["greeting"]["points"] = -10
-                    
-                    result["greeting"]["code"] = greeting_code
-                    result["greeting"]["message"] = greeting_msg
-                    
-                    # Now use smtplib for the rest
-                    server.connect(mx_host, 25)
-                    
-                    # Try TLS handshake (skip in fast mode to save time)
-                    if not fast_mode:
-                        try:
-                            server.ehlo()
-                            if server.has_extn('STARTTLS'):
-                                server.starttls()
-                                server.ehlo()
-                                result["tls_successful"] = True
-                                result["points"] += 5  # TLS successful → +5
-                        except:
-                            pass
-                    else:
-                        # In fast mode, just do EHLO
+                    server.ehlo()
+                    if server.has_extn('STARTTLS'):
+                        tls_broken = True  # until the upgrade completes
+                        verify_error = None
                         try:
+                            server.starttls(context=self._SSL_CTX)
+                            cert = server.sock.getpeercert()
+                            tls_broken = False
+                        except ssl.SSLCertVerificationError as e:
+                            # TLS works, the certificate just does not verify;
+                            # the half-finished session can only be dropped
+                            cert, verify_error = None, e
+                        # The TLS certificate and policy checks reuse this handshake
+                        self._set_cache(
+                            self._mx_tls_cache, mx_host,
+                            self._tls_certificate_result(mx_host, cert, verify_error)
+                        )
+                        if cert is not None:
+                            self._set_cache(
+                                self._mx_tls_policy_cache, mx_host,
+                                self._tls_policy_result(server.sock), ttl=self.tls_policy_ttl
+                            )
                             server.ehlo()
-                        except:
-                            pass
-                    
-                    server.quit()
-                    break
-                    
-                except Exception as e:
-                    logger.debug(f"SMTP connection error for {mx_host}: {str(e)}")
-                    continue
-                    
-            except Exception as e:
-                logger.debug(f"Port check error for {mx_host}: {str(e)}")
-                continue
+                        result["tls_successful"] = True
+                        result["points"] += 5  # TLS successful → +5
+                except (smtplib.SMTPException, OSError):
+                    pass
+            else:
+                # In fast mode, just do EHLO
+                try:
+                    server.ehlo()
+                except (smtplib.SMTPException, OSError):
+                    pass
+        
+            if tls_broken or server.ehlo_resp is None or greeting_code != 220:
+                # Broken or unwelcoming session: just drop it, no QUIT round trip
+                self._discard_smtp(server)
+            elif result["tls_successful"]:
+                # TLS-upgraded sessions advertise a different EHLO feature set, so
+                # they are not reused by other checks; sign off in the background
+                self._quit_executor.submit(self._quit_smtp, server)
+            else:
+                self._release_smtp(mx_host, server)
+        except Exception as e:
+            self._discard_smtp(server)
+            logger.debug(f"SMTP connection error for {mx_host}: {str(e)}")
         
         return result
     
-    def _check_smtp_rcpt(self, email: str, domain: str, mx_hosts: List[str], smtp_connection: Dict, fast_mode: bool = True) -> Dict:
-        """6. SMTP RCPT TO / Verification Response"""
+    def _check_smtp_rcpt(
+        self,
+        email: str,
+        domain: str,
+        mx_hosts: List[str],
+        smtp_connection: Dict,
+        fast_mode: bool = True,
+        catch_all_email: Optional[str] = None,
+    ) -> Dict:
+        """6. SMTP RCPT TO / Verification Response
+        With catch_all_email, that address is probed after the real one in the same
+        transaction and the outcome lands in catch_all_detected / catch_all_code."""
         result = {
             "accepted": False,
             "rejected": False,
@@ -723,71 +1788,61 @@ class EmailVerifier:
         
         if smtp_connection.get("skipped") or not smtp_connection.get("port_25_open"):
             result["skipped"] = True
+            if smtp_connection.get("provider_blocked"):
+                result["reason"] = "provider_blocks_rcpt"
             return result
         
         mx_host = smtp_connection.get("mx_used")
         if not mx_host:
-            mx_host = mx_hosts[0] if mx_hosts else None
+            mx_host = self._working_mx(domain, mx_hosts)
         
         if not mx_host:
             return result
         
         # Use appropriate timeout based on mode
-        smtp_timeout = self.fast_smtp_timeout if fast_mode else self.smtp_timeout
+        smtp_timeout = self._adaptive_timeout(mx_host, self.fast_smtp_timeout if fast_mode else self.smtp_timeout)
         
         try:
-            server = smtplib.SMTP(timeout=smtp_timeout)
-            server.set_debuglevel(0)
-            
             start_time = time.time()
             
             try:
-                server.connect(mx_host, 25)
-                
-                # HELO/EHLO
-                code, message = server.ehlo()
-                if code != 250:
-                    server.helo()
-                
-                # MAIL FROM
-                test_sender = f"verify@{self._sender_domain}"
-                code, message = server.mail(test_sender)
-                if code not in [250, 251]:
-                    server.quit()
-                    return result
-                
-                # RCPT TO (key check)
-                code, message = server.rcpt(email)
-                response_time = time.time() - start_time
-                result["timing"]["response_time_sec"] = round(response_time, 2)
-                result["response_code"] = code
-                
-                server.quit()
+                # Timing starts before checkout so a fresh session is measured with
+                # its connect, greeting and EHLO; a pooled one adds those back below
+                with self._acquire_smtp(mx_host, smtp_timeout) as server:
+                    # MAIL FROM + RCPT TO (key check)
+                    test_sender = f"verify@{self._sender_domain}"
+                    recipients = [email, catch_all_email] if catch_all_email else [email]
+                    replies = self._check_smtp_rcpt_batch(server, test_sender, recipients)
+                    if not replies:
+                        return result
+                    
+                    code, message, replied_at = replies[email]
+                    # Queueing behind other checks to the same MX is not server latency
+                    response_time = replied_at - start_time - server.slot_wait
+                    if server.pool_reused:
+                        response_time += server.handshake_time
+                    result["timing"]["response_time_sec"] = round(response_time, 2)
+                    result["response_code"] = code
+                    if catch_all_email:
+                        result["catch_all_code"] = replies[catch_all_email][0]
+                        result["catch_all_detected"] = result["catch_all_code"] in _SMTP_OK_CODES
                 
                 # Classify response
-                if code in [250, 251]:
-                    result["accepted"] = True
-                    result["points"] += 10  # Email might exist (soft acceptance)
+                rule = _RCPT_CODE_TABLE.get(code)
+                if rule is not None:
+                    flags, points, error = rule
+                    for flag in flags:
+                        result[flag] = True
+                    result["points"] += points
+                    if error:
+                        result["error"] = error
                 elif code == 550:
+                    result["rejected"] = True
+                    result["points"] = 0
                     # Check for "User unknown" or "5.1.1"
-                    msg_lower = str(message).lower()
-                    if "user unknown" in msg_lower or "5.1.1" in msg_lower:
-                        result["rejected"] = True
-                        result["hard_failure"] = True
-                        result["points"] = 0  # Hard failure → score = 0-10
+                    if _USER_UNKNOWN_RE.search(str(message)):
+                        result["hard_failure"] = True  # Hard failure → score = 0-10
                         result["error"] = "User unknown"
-                    else:
-                        result["rejected"] = True
-                        result["points"] = 0
-                elif code in [450, 451]:
-                    # Soft failures / Greylisting
-                    result["soft_failure"] = True
-                    result["points"] += 10  # Email might exist → +10
-                    result["error"] = "Temporarily unavailable (greylisted)"
-                elif code == 421:
-                    result["soft_failure"] = True
-                    result["points"] += 10  # Try again later → +10
-                    result["error"] = "Service unavailable, try again later"
                 elif 500 <= code < 600:
                     result["rejected"] = True
                     result["hard_failure"] = True
@@ -804,6 +1859,9 @@ class EmailVerifier:
                 else:
                     result["timing"]["points"] = 5  # Normal latency → +5
                 
+            except SMTPSlotUnavailable:
+                result["skipped"] = True
+                result["reason"] = "mx_slot_unavailable"
             except smtplib.SMTPServerDisconnected:
                 result["error"] = "Server disconnected"
             except socket.timeout:
@@ -816,7 +1874,7 @@ class EmailVerifier:
         
         return result
     
-    def _check_security_reputation(self, domain: str) -> Dict:
+    def _check_security_reputation(self, domain: str, fast_mode: bool = False) -> Dict:
         """8. Domain Security Reputation Signals"""
         result = {
             "strong_spf": False,
@@ -824,10 +1882,10 @@ class EmailVerifier:
             "points": 0
         }
         
-        # Get deliverability info (cached)
+        # Get deliverability info (cached); a fast-mode entry lacks DKIM for full mode
         deliverability = self._get_cached(self._deliverability_cache, domain)
-        if deliverability is None:
-            deliverability = self._check_deliverability(domain)
+        if deliverability is None or not (fast_mode or deliverability.get("dkim_checked", True)):
+            deliverability = self._check_deliverability(domain, fast_mode)
             self._set_cache(self._deliverability_cache, domain, deliverability)
         
         # Check SPF syntax strength (basic check)
@@ -845,7 +1903,7 @@ class EmailVerifier:
         
         return result
     
-    def _check_web_presence(self, domain: str) -> Dict:
+    def _check_web_presence(self, domain: str, session: Optional[requests.Session] = None) -> Dict:
         """9. Web Presence Check (Domain-Level Only)"""
         result = {
             "has_website": False,
@@ -860,22 +1918,31 @@ class EmailVerifier:
             return cached
         
         try:
-            # Try HTTP and HTTPS
-            for protocol in ['https', 'http']:
+            # Try HTTPS and HTTP at once; the first to answer below 500 wins,
+            # otherwise any answer counts (HTTPS preferred)
+            http = session or self._http
+            futures = {
+                self._http_executor.submit(self._probe_website, f"{protocol}://{domain}", http): protocol
+                for protocol in ['https', 'http']
+            }
+            statuses = {}
+            for future in as_completed(futures):
                 try:
-                    url = f"{protocol}://{domain}"
-                    response = requests.get(url, timeout=5, allow_redirects=True)
-                    result["has_website"] = True
-                    result["http_status"] = response.status_code
-                    
-                    result["points"] += 5  # Domain has a website → +5
-                    if response.status_code == 200:
-                        result["points"] += 5  # Website returns 200 OK → +5
-                    break
-                except:
+                    statuses[futures[future]] = future.result()
+                except Exception:
                     continue
+                if statuses[futures[future]] < 500:
+                    result["http_status"] = statuses[futures[future]]
+                    break
+            if result["http_status"] is None and statuses:
+                result["http_status"] = statuses.get('https', statuses.get('http'))
             
-            if not result["has_website"]:
+            if result["http_status"] is not None:
+                result["has_website"] = True
+                result["points"] += 5  # Domain has a website → +5
+                if result["http_status"] == 200:
+                    result["points"] += 5  # Website returns 200 OK → +5
+            else:
                 result["points"] = -10  # Website dead → -10
                 
         except Exception as e:
@@ -885,19 +1952,27 @@ class EmailVerifier:
         self._set_cache(self._web_presence_cache, domain, result)
         return result
     
-    def _check_deliverability(self, domain: str) -> Dict:
-        """Check SPF, DKIM, and DMARC records"""
+    @staticmethod
+    def _probe_website(url: str, session: requests.Session) -> int:
+        """HEAD the URL, retrying as a headers-only GET for servers that reject HEAD"""
+        response = session.head(url, timeout=3, allow_redirects=True)
+        if response.status_code >= 400:
+            response = session.get(url, timeout=3, allow_redirects=True, stream=True)
+            response.close()
+        return response.status_code
+    
+    def _check_deliverability(self, domain: str, fast_mode: bool = False) -> Dict:
+        """Check SPF, DKIM, and DMARC records (DKIM skipped in fast mode)"""
         result = {
             "spf": False,
             "dkim": False,
             "dmarc": False,
             "spf_record": None,
             "dmarc_record": None,
+            "dkim_checked": not fast_mode,
         }
         
-        resolver = dns.resolver.Resolver()
-        resolver.timeout = 2.0
-        resolver.lifetime = 4.0
+        resolver = self._resolver
 
         # Check SPF
         try:
@@ -907,7 +1982,7 @@ class EmailVerifier:
                 if txt_string.startswith('v=spf1'):
                     result["spf"] = True
                     result["spf_record"] = txt_string
-        except:
+        except dns.exception.DNSException:
             pass
         
         # Check DMARC
@@ -919,26 +1994,56 @@ class EmailVerifier:
                 if txt_string.startswith('v=DMARC1'):
                     result["dmarc"] = True
                     result["dmarc_record"] = txt_string
-        except:
+        except dns.exception.DNSException:
             pass
         
-        # Check DKIM
-        common_selectors = ['default', 'google', 'selector1', 'selector2', 'k1', 'mail']
-        for selector in common_selectors:
-            try:
-                dkim_domain = f"{selector}._domainkey.{domain}"
-                resolver.resolve(dkim_domain, 'TXT')
-                result["dkim"] = True
-                break
-            except:
-                continue
+        # Check DKIM (selectors queried concurrently, first hit wins)
+        if fast_mode:
+            return result
+        try:
+            result["dkim"] = self._run_async(self._probe_dkim_async(domain))
+        except Exception as e:
+            logger.debug(f"DKIM probe error for {domain}: {str(e)}")
         
         return result
     
+    def _check_smtp_rcpt_batch(
+        self, server: smtplib.SMTP, sender: str, emails: List[str]
+    ) -> Dict[str, Tuple[int, bytes, float]]:
+        """One MAIL FROM followed by a RCPT TO per email on an open session.
+        Returns {email: (code, message, time the reply arrived)}, or {} if MAIL FROM
+        is refused. With PIPELINING (RFC 2920) all RCPTs are sent before reading replies."""
+        started = time.monotonic()
+        code, _ = server.mail(sender)
+        if code not in _SMTP_OK_CODES:
+            return {}
+        self._record_mx_latency(server._host, time.monotonic() - started)
+        
+        replies: Dict[str, Tuple[int, bytes, float]] = {}
+        if server.has_extn('pipelining'):
+            started = time.monotonic()
+            for email in emails:
+                server.putcmd("rcpt", f"TO:{smtplib.quoteaddr(email)}")
+            for email in emails:
+                code, message = server.getreply()
+                replies[email] = (code, message, time.time())
+            self._record_mx_latency(server._host, time.monotonic() - started)
+        else:
+            for email in emails:
+                started = time.monotonic()
+                code, message = server.rcpt(email)
+                replies[email] = (code, message, time.time())
+                self._record_mx_latency(server._host, time.monotonic() - started)
+        return replies
+    
+    @staticmethod
+    def _random_catch_all_email(domain: str) -> str:
+        random_string = ''.join(random.choices(string.ascii_lowercase + string.digits, k=15))
+        return f"{random_string}@{domain}"
+    
     def _detect_catch_all(self, domain: str, mx_hosts: List[str]) -> Dict:
         """Detect if domain uses catch-all by testing a random email"""
-        random_string = ''.join(random.choices(string.ascii_lowercase + string.digits, k=15))
-        test_email = f"{random_string}@{domain}"
+        test_email = self._random_catch_all_email(domain)
         
         result = {
             "is_catchall": False,
@@ -973,17 +2078,11 @@ class EmailVerifier:
             result["skipped"] = True
             return result
         
-        mx_host = smtp_connection.get("mx_used") or mx_hosts[0]
+        mx_host = smtp_connection.get("mx_used") or self._working_mx(domain, mx_hosts)
         
         # Use shorter timeout for fingerprinting
         try:
-            server = smtplib.SMTP(timeout=5)
-            server.set_debuglevel(0)
-            
-            try:
-                server.connect(mx_host, 25)
-                server.ehlo()
-                
+            with self._acquire_smtp(mx_host, self._adaptive_timeout(mx_host, 5)) as server:
                 # Check capabilities
                 capabilities = {
                     "PIPELINING": server.has_extn('PIPELINING'),
@@ -1010,17 +2109,12 @@ class EmailVerifier:
                 try:
                     server.noop()
                     result["early_close"] = False
-                except:
+                except (smtplib.SMTPException, OSError):
                     result["early_close"] = True
                     result["points"] = max(0, result["points"] - 3)
-                
-                server.quit()
-            except Exception as e:
-                logger.debug(f"MPF check error: {str(e)}")
-                result["error"] = str(e)
         except Exception as e:
-            logger.debug(f"MPF connection error: {str(e)}")
-            result["skipped"] = True
+            logger.debug(f"MPF check error: {str(e)}")
+            result["error"] = str(e)
         
         return result
     
@@ -1035,31 +2129,16 @@ class EmailVerifier:
         error = smtp_rcpt.get("error") or smtp_connection.get("error", "")
         error_lower = str(error).lower()
         
-        # Classify error patterns
-        if "rate limit" in error_lower or "too many" in error_lower or "429" in error_lower:
-            result["category"] = "rate_limited"
-            result["points"] = 5  # Provider exists, mailbox likely exists
-            result["pattern"] = "Rate limited"
-        elif "greylist" in error_lower or "451" in error_lower or "temporarily" in error_lower:
-            result["category"] = "greylist"
-            result["points"] = 10  # Mailbox exists but temporarily blocked
-            result["pattern"] = "Greylisted"
-        elif "policy" in error_lower or "privacy" in error_lower or "not allowed" in error_lower:
-            result["category"] = "policy_block"
-            result["points"] = 3  # Domain protects privacy
-            result["pattern"] = "Policy block"
-        elif "connection refused" in error_lower or "refused" in error_lower:
-            result["category"] = "connection_refused"
-            result["points"] = 3  # Server alive but private
-            result["pattern"] = "Connection refused"
-        elif "timeout" in error_lower or "dead" in error_lower or "no route" in error_lower:
-            result["category"] = "dead_server"
-            result["points"] = -20  # Domain inactive
-            result["pattern"] = "Dead server"
-        elif "reset" in error_lower:
-            result["category"] = "connection_reset"
-            result["points"] = 0
-            result["pattern"] = "Connection reset"
+        # Classify error patterns: one scan, highest-priority category wins
+        rank = None
+        for match in _SMTP_ERROR_RE.finditer(error_lower):
+            match_rank = _SMTP_ERROR_PRIORITY[match.lastgroup]
+            if rank is None or match_rank < rank:
+                rank = match_rank
+                if rank == 0:
+                    break
+        if rank is not None:
+            result["category"], result["points"], result["pattern"], _ = _SMTP_ERROR_CATEGORIES[rank]
         else:
             result["category"] = "unknown"
             result["points"] = 0
@@ -1075,33 +2154,63 @@ class EmailVerifier:
             "adjusted_score": current_score
         }
         
-        domain_lower = domain.lower()
-        
         # Find matching provider rule
-        for provider, rules in self.provider_rules.items():
-            if provider in domain_lower or domain_lower.endswith('.' + provider):
-                result["provider"] = provider
-                result["rule_applied"] = True
-                
-                # Apply max score limit if RCPT didn't succeed
-                if not smtp_rcpt.get("accepted"):
-                    max_score = rules.get("max_score_without_rcpt", 100)
-                    if current_score > max_score:
-                        result["score_adjusted"] = True
-                        result["adjusted_score"] = max_score
-                        result["reason"] = f"Provider {provider} blocks verification, max score without RCPT: {max_score}"
-                
-                # Zoho gets more confidence
-                if provider == "zoho.com" and smtp_rcpt.get("rejected"):
-                    # Zoho's rejections are more reliable
-                    result["reliable_rejection"] = True
-                
-                break
+        provider = self._match_provider(domain.lower())
+        if provider:
+            rules = self.provider_rules[provider]
+            result["provider"] = provider
+            result["rule_applied"] = True
+            
+            # Apply max score limit if RCPT didn't succeed
+            if not smtp_rcpt.get("accepted"):
+                max_score = rules.get("max_score_without_rcpt", 100)
+                if current_score > max_score:
+                    result["score_adjusted"] = True
+                    result["adjusted_score"] = max_score
+                    result["reason"] = f"Provider {provider} blocks verification, max score without RCPT: {max_score}"
+            
+            # Zoho gets more confidence
+            if provider == "zoho.com" and smtp_rcpt.get("rejected"):
+                # Zoho's rejections are more reliable
+                result["reliable_rejection"] = True
         
         return result
     
-    def _smtp_retry_simulation(self, email: str, domain: str, mx_hosts: List[str]) -> Dict:
+    def _provider_blocks_rcpt(self, domain_lower: str) -> bool:
+        """True for a provider (or subdomain of one) known to refuse unauthenticated
+        RCPT probes, so the SMTP dialogue can be skipped entirely"""
+        provider = self._match_provider(domain_lower)
+        if not provider or not self.provider_rules[provider].get("always_blocks"):
+            return False
+        return domain_lower == provider or domain_lower.endswith('.' + provider)
+    
+    def _match_provider(self, domain_lower: str) -> Optional[str]:
+        """First provider rule (in table order) whose key occurs in the domain"""
+        return _first_pattern(domain_lower, self.provider_rules, self._provider_ac)
+    
+    def _is_greylisted(self, smtp_rcpt: Dict) -> bool:
+        """Whether the RCPT outcome looks temporary, i.e. a retry could change it"""
+        if smtp_rcpt.get("soft_failure"):
+            return True
+        return self._classify_smtp_error_pattern(smtp_rcpt, {})["category"] == "greylist"
+    
+    def _rcpt_attempt(self, mx_host: str, email: str) -> Tuple[int, bytes]:
+        """One MAIL FROM + RCPT TO for email on a pooled session"""
+        with self._acquire_smtp(mx_host, 5) as server:
+            server.mail(f"verify@{self._sender_domain}")
+            return server.rcpt(email)
+    
+    def _smtp_retry_simulation(
+        self, email: str, domain: str, mx_hosts: List[str], smtp_rcpt: Optional[Dict] = None
+    ) -> Dict:
         """4. SMTP Retry Simulation (for greylisting)"""
+        return self._run_async(self._smtp_retry_simulation_async(email, domain, mx_hosts, smtp_rcpt))
+    
+    async def _smtp_retry_simulation_async(
+        self, email: str, domain: str, mx_hosts: List[str], smtp_rcpt: Optional[Dict] = None
+    ) -> Dict:
+        """4. SMTP Retry Simulation (for greylisting)
+        Given the first RCPT outcome, retries only when it looked temporary."""
         result = {
             "success_after_retry": False,
             "retries": [],
@@ -1111,51 +2220,43 @@ class EmailVerifier:
         if not mx_hosts:
             result["skipped"] = True
             return result
+        if smtp_rcpt is not None and not self._is_greylisted(smtp_rcpt):
+            result["skipped"] = True
+            result["reason"] = "not_greylisted"
+            return result
         
-        mx_host = mx_hosts[0]
+        # Retry against the MX that answered the first time
+        mx_host = self._working_mx(domain, mx_hosts)
         # Reduced delays for faster response: 0, 2 seconds (instead of 0, 1, 5)
         retry_delays = [0, 2]
         
+        loop = asyncio.get_running_loop()
         for delay in retry_delays:
             if delay > 0:
-                time.sleep(delay)
+                await asyncio.sleep(delay)
             
             try:
                 # Use shorter timeout for retries
-                server = smtplib.SMTP(timeout=5)
-                server.set_debuglevel(0)
-                
-                try:
-                    server.connect(mx_host, 25)
-                    server.ehlo()
-                    test_sender = f"verify@{self._sender_domain}"
-                    server.mail(test_sender)
-                    
-                    code, message = server.rcpt(email)
-                    retry_result = {
-                        "delay": delay,
-                        "code": code,
-                        "message": str(message),
-                        "success": code in [250, 251]
-                    }
-                    result["retries"].append(retry_result)
-                    
-                    if code in [250, 251]:
-                        result["success_after_retry"] = True
-                        result["points"] = 20  # +20 for strong confirmation
-                        server.quit()
-                        break
-                    
-                    server.quit()
-                except Exception as e:
-                    result["retries"].append({
-                        "delay": delay,
-                        "error": str(e),
-                        "success": False
-                    })
+                code, message = await loop.run_in_executor(self._smtp_executor, self._rcpt_attempt, mx_host, email)
             except Exception as e:
                 logger.debug(f"Retry simulation error: {str(e)}")
+                result["retries"].append({
+                    "delay": delay,
+                    "error": str(e),
+                    "success": False
+                })
                 continue
+            
+            result["retries"].append({
+                "delay": delay,
+                "code": code,
+                "message": str(message),
+                "success": code in _SMTP_OK_CODES
+            })
+            if code in _SMTP_OK_CODES:
+                result["success_after_retry"] = True
+                result["points"] = 20  # +20 for strong confirmation
+                break
         
         return result
     
@@ -1169,60 +2270,107 @@ class EmailVerifier:
             "reputable_ca": False
         }
         
+        # Usually already filled in from the STARTTLS handshake of the SMTP connection test
+        cached = self._get_cached(self._mx_tls_cache, mx_host)
+        if cached:
+            return cached
+        
+        server = None
         try:
-            # Try to get certificate
-            context = ssl.create_default_context()
-            with socket.create_connection((mx_host, 25), timeout=5) as sock:
+            # Port 25 is plaintext until STARTTLS, so the certificate comes after the upgrade
+            server = self._open_smtp(mx_host, 5)
+            server.ehlo()
+            cert = None
+            verify_error = None
+            if server.has_extn('starttls'):
                 try:
-                    with context.wrap_socket(sock, server_hostname=mx_host) as ssock:
-                        cert = ssock.getpeercert()
-                        
-                        # Check if domain matches
-                        if cert:
-                            subject = dict(x[0] for x in cert.get('subject', []))
-                            issuer = dict(x[0] for x in cert.get('issuer', []))
-                            
-                            # Check domain match
-                            common_name = subject.get('commonName', '')
-                            if mx_host in common_name or common_name in mx_host:
-                                result["domain_match"] = True
-                                result["points"] += 5
-                            
-                            # Check if reputable CA (not self-signed)
-                            if issuer.get('commonName') != subject.get('commonName'):
-                                result["reputable_ca"] = True
-                                result["points"] += 5
-                            else:
-                                result["self_signed"] = True
-                                result["points"] -= 10
-                            
-                            # Check expiration
-                            not_after = cert.get('notAfter')
-                            if not_after:
-                                try:
-                                    from dateutil import parser
-                                    exp_date = parser.parse(not_after)
-                                    if exp_date < datetime.now():
-                                        result["expired"] = True
-                                        result["points"] -= 10
-                                except ImportError:
-                                    # Fallback to basic parsing
-                                    try:
-                                        exp_date = datetime.fromisoformat(not_after.replace('Z', '+00:00'))
-                                        if exp_date < datetime.now():
-                                            result["expired"] = True
-                                            result["points"] -= 10
-                                    except:
-                                        pass
-                                except:
-                                    pass
+                    server.starttls(context=self._SSL_CTX)
+                    cert = server.sock.getpeercert()
+                except ssl.SSLCertVerificationError as e:
+                    verify_error = e
                 except ssl.SSLError:
-                    # No TLS support or connection issue
-                    result["no_tls"] = True
+                    # Failed handshake
+                    pass
+            self._discard_smtp(server)
+            result = self._tls_certificate_result(mx_host, cert, verify_error)
         except Exception as e:
+            self._discard_smtp(server)
             logger.debug(f"TLS certificate check error: {str(e)}")
             result["skipped"] = True
         
+        self._cache_result(self._mx_tls_cache, mx_host, result)
+        return result
+    
+    def _tls_certificate_result(
+        self,
+        mx_host: str,
+        cert: Optional[Dict],
+        verify_error: Optional[ssl.SSLCertVerificationError] = None,
+    ) -> Dict:
+        """Score a verified peer certificate. Without one, verify_error means TLS
+        worked but the certificate was rejected; neither means no TLS at all."""
+        result = {
+            "points": 0,
+            "self_signed": False,
+            "expired": False,
+            "domain_match": False,
+            "reputable_ca": False
+        }
+        
+        if cert is None and verify_error is not None:
+            result["certificate_invalid"] = True
+            result["verify_error"] = verify_error.verify_message
+            if verify_error.verify_code in _X509_SELF_SIGNED_CODES:
+                result["self_signed"] = True
+                result["points"] -= 10
+            elif verify_error.verify_code == _X509_CERT_HAS_EXPIRED:
+                result["expired"] = True
+                result["points"] -= 10
+            return result
+        
+        if cert is None:
+            result["no_tls"] = True
+            return result
+        
+        # Check if domain matches
+        if cert:
+            subject = dict(x[0] for x in cert.get('subject', []))
+            issuer = dict(x[0] for x in cert.get('issuer', []))
+            
+            # Check domain match
+            common_name = subject.get('commonName', '')
+            if mx_host in common_name or common_name in mx_host:
+                result["domain_match"] = True
+                result["points"] += 5
+            
+            # Check if reputable CA (not self-signed)
+            if issuer.get('commonName') != subject.get('commonName'):
+                result["reputable_ca"] = True
+                result["points"] += 5
+            else:
+                result["self_signed"] = True
+                result["points"] -= 10
+            
+            # Check expiration
+            not_after = cert.get('notAfter')
+            if not_after:
+                try:
+                    # OpenSSL's fixed notAfter format ("Jun  1 12:00:00 2026 GMT"), always UTC
+                    expires_at = ssl.cert_time_to_seconds(not_after)
+                except ValueError:
+                    expires_at = None
+                    if _dtparser is not None:
+                        try:
+                            exp_date = _dtparser.parse(not_after)
+                            if exp_date.tzinfo is None:
+                                exp_date = exp_date.replace(tzinfo=timezone.utc)
+                            expires_at = exp_date.timestamp()
+                        except (ValueError, OverflowError):
+                            pass
+                if expires_at is not None and expires_at < time.time():
+                    result["expired"] = True
+                    result["points"] -= 10
+        
         return result
     
     def _check_mail_ports(self, mx_host: str) -> Dict:
@@ -1232,24 +2380,88 @@ class EmailVerifier:
             "open_ports": []
         }
         
+        cached = self._get_cached(self._mx_ports_cache, mx_host)
+        if cached:
+            return cached
+        if self._is_circuit_open(mx_host):
+            result["skipped"] = True
+            result["circuit_open"] = True
+            return result
+        
         mail_ports = [25, 465, 587, 2525]
         
-        for port in mail_ports:
+        try:
+            for port in self._scan_ports(mx_host, mail_ports, timeout=1):
+                result["open_ports"].append(port)
+                result["points"] += 2  # +2 for each valid mail port
+        except Exception as e:
+            logger.debug(f"Mail port scan error for {mx_host}: {str(e)}")
+            result["skipped"] = True
+        
+        if not result.get("skipped"):
+            self._set_cache(self._mx_ports_cache, mx_host, result)
+        return result
+    
+    def _scan_ports(self, host: str, ports: List[int], timeout: float = 1) -> List[int]:
+        """Connect to all ports at once with non-blocking sockets and return the open ones.
+        The timeout applies to the whole batch rather than to each port."""
+        connected = self._connect_all(self._resolve_mx_ip(host), ports, timeout)
+        return sorted(port for port, retrans in zip(ports, connected) if retrans is not None)
+    
+    @staticmethod
+    def _connect_all(ip_address: str, ports: List[int], timeout: float) -> List[Optional[int]]:
+        """Open one non-blocking connection per entry of ports and wait for all of them in a
+        single select. Returns, per entry, None if it did not connect within timeout, else
+        the kernel's retransmission count for the handshake (0 where TCP_INFO is unavailable).
+        Sockets are closed with SO_LINGER=0 (RST instead of FIN) so probes leave no TIME_WAIT behind."""
+        def retransmissions(sock: socket.socket) -> int:
+            if not hasattr(socket, 'TCP_INFO'):
+                return 0
             try:
+                info = sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_INFO, _TCP_INFO.size)
+                return _TCP_INFO.unpack(info)[_TCPI_TOTAL_RETRANS]
+            except (OSError, struct.error):
+                return 0
+        
+        selector = selectors.DefaultSelector()
+        connected: List[Optional[int]] = [None] * len(ports)
+        try:
+            for index, port in enumerate(ports):
                 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(1)  # Reduced from 2 to 1 second for faster scanning
-                result_code = sock.connect_ex((mx_host, port)) == 0
-                sock.close()
-                
-                if result_code:
-                    result["open_ports"].append(port)
-                    result["points"] += 2  # +2 for each valid mail port
-            except:
-                continue
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RST)
+                sock.setblocking(False)
+                err = sock.connect_ex((ip_address, port))
+                if err == 0:
+                    connected[index] = retransmissions(sock)
+                    sock.close()
+                elif err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    selector.register(sock, selectors.EVENT_WRITE, index)
+                else:
+                    sock.close()
+            
+            deadline = time.monotonic() + timeout
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(timeout=remaining):
+                    sock = key.fileobj
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        connected[key.data] = retransmissions(sock)
+                    selector.unregister(sock)
+                    sock.close()
+        finally:
+            for key in list(selector.get_map().values()):
+                key.fileobj.close()
+            selector.close()
         
-        return result
+        return connected
     
     def _check_dnssec(self, domain: str) -> Dict:
+        """7. DNSSEC Check"""
+        return self._run_async(self._check_dnssec_async(domain))
+    
+    async def _check_dnssec_async(self, domain: str) -> Dict:
         """7. DNSSEC Check"""
         result = {
             "points": 0,
@@ -1257,25 +2469,15 @@ class EmailVerifier:
         }
         
         try:
-            resolver = dns.resolver.Resolver()
-            resolver.timeout = 2.0
-            resolver.lifetime = 4.0
-            
             # Try to check for DNSKEY record (indicates DNSSEC)
             try:
-                resolver.resolve(domain, 'DNSKEY')
+                await self._race_resolve(domain, 'DNSKEY')
                 result["dnssec_enabled"] = True
                 result["points"] = 5  # +5 for strong DNS infrastructure
-            except:
-                # DNSSEC might be enabled but DNSKEY not at domain level
-                # Check RRSIG records
-                try:
-                    resolver.resolve(domain, 'A')
-                    # If we get here, check if response has RRSIG (would need to parse response)
-                    # For simplicity, we'll assume no DNSSEC if DNSKEY fails
-                    result["dnssec_enabled"] = False
-                except:
-                    result["dnssec_enabled"] = False
+            except dns.exception.DNSException:
+                # DNSSEC might be enabled but DNSKEY not at domain level;
+                # detecting that would need RRSIG parsing, so assume no DNSSEC
+                result["dnssec_enabled"] = False
         except Exception as e:
             logger.debug(f"DNSSEC check error: {str(e)}")
             result["skipped"] = True
@@ -1283,6 +2485,16 @@ class EmailVerifier:
         return result
     
     def _check_ptr_record(self, mx_host: str) -> Dict:
+        """8. PTR Record Verification"""
+        cached = self._get_cached(self._mx_ptr_cache, mx_host)
+        if cached:
+            return cached
+        result = self._run_async(self._check_ptr_record_async(mx_host))
+        if not result.get("skipped"):
+            self._set_cache(self._mx_ptr_cache, mx_host, result)
+        return result
+    
+    async def _check_ptr_record_async(self, mx_host: str) -> Dict:
         """8. PTR Record Verification"""
         result = {
             "points": 0,
@@ -1292,10 +2504,16 @@ class EmailVerifier:
         
         try:
             # Get IP address of MX host
-            ip_address = socket.gethostbyname(mx_host)
+            ip_address = await self._resolve_a_async(mx_host)
             
             # Reverse DNS lookup
-            ptr_record = socket.gethostbyaddr(ip_address)[0]
+            try:
+                ptr_record = await self._resolve_ptr_async(ip_address)
+            except dns.exception.DNSException:
+                # No PTR record
+                result["ptr_match"] = False
+                result["points"] = -5
+                return result
             result["ptr_record"] = ptr_record
             
             # Check if PTR matches domain or MX host
@@ -1304,10 +2522,6 @@ class EmailVerifier:
                 result["points"] = 5  # +5 if PTR matches
             else:
                 result["points"] = -5  # -5 if PTR missing/mismatch
-        except socket.herror:
-            # No PTR record
-            result["ptr_match"] = False
-            result["points"] = -5
         except Exception as e:
             logger.debug(f"PTR record check error: {str(e)}")
             result["skipped"] = True
@@ -1323,39 +2537,56 @@ class EmailVerifier:
         }
         
         try:
-            # Get IP address
-            ip_address = socket.gethostbyname(mx_host)
+            # Get IP address (MX hosts often share IPs, so results are cached per IP)
+            ip_address = self._resolve_mx_ip(mx_host)
+            cached = self._get_cached(self._ip_reputation_cache, ip_address)
+            if cached:
+                return cached
             
-            # Check Spamhaus (free query via DNS)
-            try:
-                resolver = dns.resolver.Resolver()
-                resolver.timeout = 2.0
-                # Reverse IP for Spamhaus query
-                ip_parts = ip_address.split('.')
-                reversed_ip = '.'.join(reversed(ip_parts))
-                spamhaus_query = f"{reversed_ip}.zen.spamhaus.org"
-                
-                try:
-                    resolver.resolve(spamhaus_query, 'A')
-                    # If resolved, IP is blacklisted
+            # Query all blocklists at once (free queries via DNS)
+            for source, listed in self._run_async(self._query_ip_dnsbls(ip_address)):
+                if listed is None:
+                    continue
+                result["sources_checked"].append(source)
+                if listed:
                     result["blacklisted"] = True
                     result["points"] = -10
-                    result["sources_checked"].append("spamhaus")
-                except dns.resolver.NXDOMAIN:
-                    # Not blacklisted
-                    result["sources_checked"].append("spamhaus")
-            except:
-                pass
             
             # If not blacklisted, give positive score
             if not result["blacklisted"]:
                 result["points"] = 10  # +10 if clean
+            self._set_cache(self._ip_reputation_cache, ip_address, result)
         except Exception as e:
             logger.debug(f"IP reputation check error: {str(e)}")
             result["skipped"] = True
         
         return result
     
+    async def _query_ip_dnsbls(self, ip_address: str) -> List[Tuple[str, Optional[bool]]]:
+        """Look the IP up in every IP_DNSBL_ZONES zone concurrently"""
+        return await self._query_dnsbls(_reverse_ip(ip_address), IP_DNSBL_ZONES)
+    
+    async def _query_dnsbls(
+        self, name: str, zones: List[Tuple[str, str]]
+    ) -> List[Tuple[str, Optional[bool]]]:
+        """Look name up in every (source, zone) concurrently. Listed is None
+        when a zone could not be queried. DNSBLs refuse queries relayed through
+        public resolvers, so these go to the system resolver only."""
+        async def lookup(zone: str) -> Optional[bool]:
+            try:
+                answer = await self._async_resolver.resolve(f"{name}.{zone}", 'A')
+            except dns.resolver.NXDOMAIN:
+                return False  # Not listed
+            except dns.exception.DNSException:
+                return None
+            # 127.255.255.x answers are query refusals, not listings
+            if all(record.address.startswith('127.255.255.') for record in answer):
+                return None
+            return True
+        
+        listings = await asyncio.gather(*(lookup(zone) for _, zone in zones))
+        return [(source, listed) for (source, _), listed in zip(zones, listings)]
+    
     def _analyze_server_behavior(self, smtp_connection: Dict, smtp_rcpt: Dict) -> Dict:
         """10. Mail Server Behaviour Analysis (Heuristics)"""
         result = {
@@ -1435,8 +2666,8 @@ class EmailVerifier:
         
         # Analyze response patterns
         if smtp_rcpt.get("rejected"):
-            error = smtp_rcpt.get("error", "").lower()
-            if "user unknown" in error or "550" in str(smtp_rcpt.get("response_code", "")):
+            labels = _rejection_labels(smtp_rcpt.get("error") or "")
+            if "user_unknown" in labels or smtp_rcpt.get("response_code") == 550:
                 result["behavior"] = "instant_reject"
                 result["points"] = 5  # Good - server actively rejects invalid
                 result["note"] = "Server instantly rejects unknown users (good sign)"
@@ -1447,11 +2678,11 @@ class EmailVerifier:
             result["behavior"] = "greylist"
             result["points"] = 3  # Neutral - temporary block
         elif smtp_connection.get("error"):
-            error = smtp_connection.get("error", "").lower()
-            if "timeout" in error:
+            labels = _rejection_labels(smtp_connection["error"])
+            if "timeout" in labels:
                 result["behavior"] = "timeout"
                 result["points"] = -3  # Risky
-            elif "policy" in error:
+            elif "policy" in labels:
                 result["behavior"] = "policy_block"
                 result["points"] = 2  # Neutral - privacy protection
         
@@ -1460,6 +2691,16 @@ class EmailVerifier:
     # ========== ADDITIONAL ADVANCED FEATURES (13-27) ==========
     
     def _check_mx_consistency(self, mx_host: str, domain: str) -> Dict:
+        """13. Mail Exchanger Consistency Check (MX↔A sanity test)"""
+        # Depends only on the MX host, which many domains share
+        cached = self._get_cached(self._mx_consistency_cache, mx_host)
+        if cached:
+            return cached
+        result = self._run_async(self._check_mx_consistency_async(mx_host, domain))
+        self._cache_result(self._mx_consistency_cache, mx_host, result)
+        return result
+    
+    async def _check_mx_consistency_async(self, mx_host: str, domain: str) -> Dict:
         """13. Mail Exchanger Consistency Check (MX↔A sanity test)"""
         result = {
             "points": 0,
@@ -1471,35 +2712,31 @@ class EmailVerifier:
         
         try:
             # MX → A/AAAA
-            resolver = dns.resolver.Resolver()
-            resolver.timeout = 2.0
-            resolver.lifetime = 4.0
-            
             try:
-                mx_ip = socket.gethostbyname(mx_host)
+                mx_ip = await self._resolve_a_async(mx_host)
                 result["mx_to_a"] = True
                 result["mx_ip"] = mx_ip
                 
                 # A → PTR
                 try:
-                    ptr_record = socket.gethostbyaddr(mx_ip)[0]
+                    ptr_record = await self._resolve_ptr_async(mx_ip)
                     result["a_to_ptr"] = True
                     result["ptr_record"] = ptr_record
                     
                     # PTR → A (matching)
                     try:
-                        ptr_ip = socket.gethostbyname(ptr_record)
+                        ptr_ip = await self._resolve_a_async(ptr_record)
                         if ptr_ip == mx_ip:
                             result["ptr_to_a"] = True
                             result["perfect_cycle"] = True
                             result["points"] = 10  # Perfect cycle → +10
                         else:
                             result["points"] = -10  # Broken cycle → -10
-                    except:
+                    except dns.exception.DNSException:
                         result["points"] = -10  # Broken cycle
-                except socket.herror:
+                except dns.exception.DNSException:
                     result["points"] = -10  # No PTR record
-            except:
+            except dns.exception.DNSException:
                 result["points"] = -10  # MX doesn't resolve
         except Exception as e:
             logger.debug(f"MX consistency check error: {str(e)}")
@@ -1517,29 +2754,59 @@ class EmailVerifier:
             "secure": False
         }
         
+        cached = self._get_cached(self._mx_tls_policy_cache, mx_host)
+        if cached:
+            return cached
+        
+        server = None
         try:
-            context = ssl.create_default_context()
-            with socket.create_connection((mx_host, 25), timeout=5) as sock:
+            # Port 25 is plaintext until STARTTLS, so the upgrade has to be negotiated
+            server = self._open_smtp(mx_host, 5)
+            server.ehlo()
+            if not server.has_extn('starttls'):
+                result["allows_downgrade"] = True
+                result["points"] = -5  # Weak/Downgrade-able: -5
+                self._release_smtp(mx_host, server)
+            else:
                 try:
-                    # Try STARTTLS
-                    with context.wrap_socket(sock, server_hostname=mx_host) as ssock:
-                        result["supports_starttls"] = True
-                        result["secure"] = True
-                        
-                        # Check cipher (basic check)
-                        cipher = ssock.cipher()
-                        if cipher:
-                            result["modern_ciphers"] = True
-                            result["points"] = 10  # Secure TLS: +10
-                        else:
-                            result["points"] = -5  # Weak/Downgrade-able: -5
+                    server.starttls(context=self._SSL_CTX_NOVERIFY)
+                    result = self._tls_policy_result(server.sock)
+                    # TLS sessions are not pooled; sign off in the background
+                    self._quit_executor.submit(self._quit_smtp, server)
                 except ssl.SSLError:
+                    self._discard_smtp(server)
+                    result["supports_starttls"] = True
                     result["allows_downgrade"] = True
                     result["points"] = -5  # Weak/Downgrade-able: -5
         except Exception as e:
+            self._discard_smtp(server)
             logger.debug(f"TLS policy check error: {str(e)}")
             result["skipped"] = True
         
+        self._cache_result(self._mx_tls_policy_cache, mx_host, result, ttl=self.tls_policy_ttl)
+        return result
+    
+    @staticmethod
+    def _tls_policy_result(tls_sock: ssl.SSLSocket) -> Dict:
+        """TLS policy strength of a completed STARTTLS upgrade"""
+        version = tls_sock.version()
+        cipher = tls_sock.cipher()  # (name, protocol, secret bits)
+        result = {
+            "points": 0,
+            "supports_starttls": True,
+            "allows_downgrade": False,
+            "modern_ciphers": False,
+            "secure": False,
+            "tls_version": version,
+            "cipher": cipher[0] if cipher else None
+        }
+        
+        if version in _MODERN_TLS_VERSIONS and cipher and cipher[2] >= 128:
+            result["modern_ciphers"] = True
+            result["secure"] = True
+            result["points"] = 10  # Secure TLS: +10
+        else:
+            result["points"] = -5  # Weak/Downgrade-able: -5
         return result
     
     def _check_mx_redundancy(self, mx_hosts: List[str]) -> Dict:
@@ -1550,20 +2817,10 @@ class EmailVerifier:
             "redundancy": "none"
         }
         
-        mx_count = len(mx_hosts) if mx_hosts else 0
-        
-        if mx_count == 0:
-            result["redundancy"] = "none"
-            result["points"] = -20  # Cannot receive mail
-        elif mx_count == 1:
-            result["redundancy"] = "single"
-            result["points"] = -3  # Single MX: -3
-        elif 2 <= mx_count <= 4:
-            result["redundancy"] = "strong"
-            result["points"] = 5  # Multi-MX: +5
-        else:
-            result["redundancy"] = "excessive"
-            result["points"] = 3  # Too many might indicate misconfiguration
+        # No MX cannot receive mail; more than 4 might indicate misconfiguration
+        result["redundancy"], result["points"] = _MX_REDUNDANCY_LEVELS[
+            bisect.bisect_right(_MX_REDUNDANCY_BINS, result["mx_count"])
+        ]
         
         return result
     
@@ -1580,22 +2837,23 @@ class EmailVerifier:
             result["checks"]["valid_ehlo"] = True
             result["points"] += 2
         
+        labels = _rejection_labels(smtp_rcpt.get("error") or "")
+        
         # Check if MAIL FROM was validated
         if smtp_rcpt.get("response_code"):
             code = smtp_rcpt.get("response_code")
             # If server rejected invalid MAIL FROM, it's strict
-            if code not in [250, 251] and "mail" in str(smtp_rcpt.get("error", "")).lower():
+            if code not in _SMTP_OK_CODES and "mail" in labels:
                 result["checks"]["validates_mailfrom"] = True
                 result["points"] += 3
         
         # Check if malformed commands are rejected
-        if smtp_rcpt.get("rejected") and smtp_rcpt.get("response_code") in [500, 501, 502]:
+        if smtp_rcpt.get("rejected") and smtp_rcpt.get("response_code") in _SMTP_SYNTAX_ERROR_CODES:
             result["checks"]["rejects_malformed"] = True
             result["points"] += 3
         
         # Check if anti-spam rules are enforced
-        error = smtp_rcpt.get("error", "").lower()
-        if "spam" in error or "policy" in error or "block" in error:
+        if "antispam" in labels or "policy" in labels:
             result["checks"]["enforces_antispam"] = True
             result["points"] += 2
         
@@ -1631,29 +2889,18 @@ class EmailVerifier:
         fake_sender = f"test@{fake_domain}"
         
         try:
-            server = smtplib.SMTP(timeout=5)
-            server.set_debuglevel(0)
-            
-            try:
-                server.connect(mx_host, 25)
-                server.ehlo()
-                
+            with self._acquire_smtp(mx_host, 5) as server:
                 # Try MAIL FROM with fake domain
                 code, message = server.mail(fake_sender)
-                
-                if code not in [250, 251]:
-                    result["rejects_rare_domain"] = True
-                    result["points"] = 7  # Reject rare MAIL FROM → +7
-                else:
-                    result["accepts_anything"] = True
-                    result["points"] = -7  # Accept anything → -7
-                
-                server.quit()
-            except Exception as e:
-                logger.debug(f"MAIL FROM health check error: {str(e)}")
+            
+            if code not in _SMTP_OK_CODES:
+                result["rejects_rare_domain"] = True
+                result["points"] = 7  # Reject rare MAIL FROM → +7
+            else:
+                result["accepts_anything"] = True
+                result["points"] = -7  # Accept anything → -7
         except Exception as e:
-            logger.debug(f"MAIL FROM connection error: {str(e)}")
-            result["skipped"] = True
+            logger.debug(f"MAIL FROM health check error: {str(e)}")
         
         return result
     
@@ -1672,18 +2919,8 @@ class EmailVerifier:
         rcpt_time = timing.get("response_time_sec", 0)
         
         # Analyze latency patterns
-        if rcpt_time < 0.5:
-            result["pattern"] = "instant_reject"
-            result["points"] = -10  # Instant reject → -10
-        elif 0.5 <= rcpt_time <= 3:
-            result["pattern"] = "normal"
-            result["points"] = 8  # Normal latency pattern → +8
-        elif 3 < rcpt_time <= 10:
-            result["pattern"] = "slow"
-            result["points"] = 0
-        else:
-            result["pattern"] = "very_slow"
-            result["points"] = -5  # Very slow → -5
+        index = 0 if rcpt_time < 0.5 else 1 + bisect.bisect_left(_LATENCY_BINS, rcpt_time)
+        result["pattern"], result["points"] = _LATENCY_PATTERNS[index]
         
         return result
     
@@ -1702,31 +2939,22 @@ class EmailVerifier:
         # Test first 2 MX hosts
         for mx_host in mx_hosts[:2]:
             try:
-                server = smtplib.SMTP(timeout=5)
-                server.set_debuglevel(0)
-                
-                try:
-                    server.connect(mx_host, 25)
-                    server.ehlo()
+                with self._acquire_smtp(mx_host, 5) as server:
                     test_sender = f"verify@{self._sender_domain}"
                     server.mail(test_sender)
                     
                     code, message = server.rcpt(email)
-                    result["responses"].append({
-                        "mx": mx_host,
-                        "code": code,
-                        "message": str(message)
-                    })
-                    
-                    server.quit()
-                except Exception as e:
-                    result["responses"].append({
-                        "mx": mx_host,
-                        "error": str(e)
-                    })
+                result["responses"].append({
+                    "mx": mx_host,
+                    "code": code,
+                    "message": str(message)
+                })
             except Exception as e:
                 logger.debug(f"Load balancer check error for {mx_host}: {str(e)}")
-                continue
+                result["responses"].append({
+                    "mx": mx_host,
+                    "error": str(e)
+                })
         
         # Check if responses are consistent
         if len(result["responses"]) >= 2:
@@ -1753,39 +2981,33 @@ class EmailVerifier:
             return result
         
         mx_host = smtp_connection.get("mx_used") or mx_hosts[0]
+        domain_rcpt = f"@{domain}"
         
         try:
-            server = smtplib.SMTP(timeout=5)
-            server.set_debuglevel(0)
-            
-            try:
-                server.connect(mx_host, 25)
-                server.ehlo()
-                test_sender = f"verify@{self._sender_domain}"
-                server.mail(test_sender)
-                
-                # Test RCPT TO:<@domain.com>
-                code1, msg1 = server.rcpt(f"@{domain}")
-                result["domain_response"] = {"code": code1, "message": str(msg1)}
-                
-                # Test RCPT TO:<realuser@domain.com>
-                code2, msg2 = server.rcpt(email)
-                result["user_response"] = {"code": code2, "message": str(msg2)}
-                
-                # Compare responses
-                if code1 != code2:
-                    result["different_responses"] = True
-                    result["points"] = 6  # Different responses → +6
-                else:
-                    result["points"] = -6  # Identical → -6
-                
-                server.quit()
-            except Exception as e:
-                logger.debug(f"VRFY lite check error: {str(e)}")
-                result["skipped"] = True
+            # RCPT TO:<@domain.com> and RCPT TO:<realuser@domain.com> in one transaction
+            with self._acquire_smtp(mx_host, 5) as server:
+                replies = self._check_smtp_rcpt_batch(
+                    server, f"verify@{self._sender_domain}", [domain_rcpt, email]
+                )
         except Exception as e:
-            logger.debug(f"VRFY lite connection error: {str(e)}")
+            logger.debug(f"VRFY lite check error: {str(e)}")
+            replies = {}
+        
+        if domain_rcpt not in replies or email not in replies:
             result["skipped"] = True
+            return result
+        
+        code1, msg1, _ = replies[domain_rcpt]
+        code2, msg2, _ = replies[email]
+        result["domain_response"] = {"code": code1, "message": str(msg1)}
+        result["user_response"] = {"code": code2, "message": str(msg2)}
+        
+        # Compare responses
+        if code1 != code2:
+            result["different_responses"] = True
+            result["points"] = 6  # Different responses → +6
+        else:
+            result["points"] = -6  # Identical → -6
         
         return result
     
@@ -1805,34 +3027,31 @@ class EmailVerifier:
             result["skipped"] = True
             return result
         
-        mx_host = mx_hosts[0]
+        mx_host = self._working_mx(domain, mx_hosts) or mx_hosts[0]
+        role_emails = {f"{role}@{domain}": role for role in role_accounts}
         
-        for role in role_accounts:
-            role_email = f"{role}@{domain}"
-            try:
-                server = smtplib.SMTP(timeout=3)
-                server.set_debuglevel(0)
-                
-                try:
-                    server.connect(mx_host, 25)
-                    server.ehlo()
-                    test_sender = f"verify@{self._sender_domain}"
-                    server.mail(test_sender)
-                    
-                    code, message = server.rcpt(role_email)
-                    is_valid = code in [250, 251]
-                    result["role_accounts"][role] = {
-                        "valid": is_valid,
-                        "code": code
-                    }
-                    if is_valid:
-                        valid_count += 1
-                    
-                    server.quit()
-                except:
-                    result["role_accounts"][role] = {"valid": False, "error": True}
-            except:
+        # One session and one MAIL FROM for all roles, RSET on release
+        try:
+            with self._acquire_smtp(mx_host, 3) as server:
+                replies = self._check_smtp_rcpt_batch(
+                    server, f"verify@{self._sender_domain}", list(role_emails)
+                )
+        except (smtplib.SMTPException, OSError) as e:
+            logger.debug(f"Role account check failed for {domain}: {e}")
+            replies = {}
+        
+        for role_email, role in role_emails.items():
+            if role_email not in replies:
                 result["role_accounts"][role] = {"valid": False, "error": True}
+                continue
+            code = replies[role_email][0]
+            is_valid = code in _SMTP_OK_CODES
+            result["role_accounts"][role] = {
+                "valid": is_valid,
+                "code": code
+            }
+            if is_valid:
+                valid_count += 1
         
         if valid_count == len(role_accounts):
             result["all_valid"] = True
@@ -1853,36 +3072,29 @@ class EmailVerifier:
         
         mx_lower = mx_host.lower()
         
-        # Known trusted MX brands
-        trusted_brands = {
-            "google.com": "Gmail",
-            "outlook.com": "Microsoft",
-            "secureserver.net": "GoDaddy",
-            "privateemail.com": "Namecheap",
-            "mailsrvr.com": "Rackspace",
-            "amazonaws.com": "AWS SES",
-            "sendgrid.net": "SendGrid",
-            "mailgun.org": "Mailgun",
-            "mailgun.com": "Mailgun",
-            "zoho.com": "Zoho",
-            "yahoo.com": "Yahoo",
-            "aol.com": "AOL"
-        }
-        
-        for brand_pattern, brand_name in trusted_brands.items():
-            if brand_pattern in mx_lower:
-                result["brand"] = brand_name
-                result["trusted"] = True
-                result["points"] = 10  # Trusted MX brand → +10
-                return result
+        brand_pattern = _first_pattern(mx_lower, _TRUSTED_MX_BRANDS, _TRUSTED_MX_AC)
+        if brand_pattern is not None:
+            result["brand"] = _TRUSTED_MX_BRANDS[brand_pattern]
+            result["trusted"] = True
+            result["points"] = 10  # Trusted MX brand → +10
+            return result
         
         result["brand"] = "custom"
         result["points"] = 0
         
         return result
     
-    def _check_greylist_depth(self, email: str, domain: str, mx_hosts: List[str]) -> Dict:
+    def _check_greylist_depth(
+        self, email: str, domain: str, mx_hosts: List[str], smtp_rcpt: Optional[Dict] = None
+    ) -> Dict:
         """23. Greylist "Depth Check" """
+        return self._run_async(self._check_greylist_depth_async(email, domain, mx_hosts, smtp_rcpt))
+    
+    async def _check_greylist_depth_async(
+        self, email: str, domain: str, mx_hosts: List[str], smtp_rcpt: Optional[Dict] = None
+    ) -> Dict:
+        """23. Greylist "Depth Check"
+        The first RCPT outcome, when given, counts as attempt 1 instead of a new session."""
         result = {
             "points": 0,
             "depth": 0,
@@ -1892,49 +3104,49 @@ class EmailVerifier:
         if not mx_hosts:
             result["skipped"] = True
             return result
+        if smtp_rcpt is not None and not self._is_greylisted(smtp_rcpt):
+            result["skipped"] = True
+            result["reason"] = "not_greylisted"
+            return result
         
-        mx_host = mx_hosts[0]
+        mx_host = self._working_mx(domain, mx_hosts)
         responses = []
+        first_attempt = 0
+        if smtp_rcpt is not None and smtp_rcpt.get("response_code") is not None:
+            responses.append({
+                "attempt": 1,
+                "code": smtp_rcpt["response_code"],
+                "message": str(smtp_rcpt.get("error"))
+            })
+            first_attempt = 1
         
         # Simulate 3 attempts
-        for attempt in range(3):
+        loop = asyncio.get_running_loop()
+        for attempt in range(first_attempt, 3):
             if attempt > 0:
-                time.sleep(2)  # Wait between attempts
+                await asyncio.sleep(2)  # Wait between attempts
             
             try:
-                server = smtplib.SMTP(timeout=5)
-                server.set_debuglevel(0)
+                code, message = await loop.run_in_executor(self._smtp_executor, self._rcpt_attempt, mx_host, email)
+                responses.append({
+                    "attempt": attempt + 1,
+                    "code": code,
+                    "message": str(message)
+                })
                 
-                try:
-                    server.connect(mx_host, 25)
-                    server.ehlo()
-                    test_sender = f"verify@{self._sender_domain}"
-                    server.mail(test_sender)
-                    
-                    code, message = server.rcpt(email)
-                    responses.append({
-                        "attempt": attempt + 1,
-                        "code": code,
-                        "message": str(message)
-                    })
-                    
-                    server.quit()
-                    
-                    # Check if pattern matches greylist behavior
-                    if code in [250, 251]:
-                        result["depth"] = attempt + 1
-                        if attempt >= 1:  # Accepted after retry
-                            result["pattern_matches"] = True
-                            result["points"] = 10  # Greylist depth matches → +10
-                        break
-                except Exception as e:
-                    responses.append({
-                        "attempt": attempt + 1,
-                        "error": str(e)
-                    })
+                # Check if pattern matches greylist behavior
+                if code in _SMTP_OK_CODES:
+                    result["depth"] = attempt + 1
+                    if attempt >= 1:  # Accepted after retry
+                        result["pattern_matches"] = True
+                        result["points"] = 10  # Greylist depth matches → +10
+                    break
             except Exception as e:
                 logger.debug(f"Greylist depth check error: {str(e)}")
-                break
+                responses.append({
+                    "attempt": attempt + 1,
+                    "error": str(e)
+                })
         
         result["responses"] = responses
         return result
@@ -1951,26 +3163,19 @@ class EmailVerifier:
         banner_lower = banner_message.lower()
         
         # Check for professional metadata patterns
-        professional_patterns = [
-            "esmtp", "postfix", "sendmail", "exim", "microsoft", "exchange",
-            "mailjet", "sendgrid", "mailgun", "amazon", "google"
-        ]
-        
-        for pattern in professional_patterns:
-            if pattern in banner_lower:
-                result["has_metadata"] = True
-                result["provider_identified"] = True
-                result["professional"] = True
-                result["points"] = 8  # Professional metadata → +8
-                result["identified_provider"] = pattern
-                return result
+        pattern = _first_pattern(banner_lower, _PROFESSIONAL_BANNER_PATTERNS, _PROFESSIONAL_BANNER_AC)
+        if pattern is not None:
+            result["has_metadata"] = True
+            result["provider_identified"] = True
+            result["professional"] = True
+            result["points"] = 8  # Professional metadata → +8
+            result["identified_provider"] = pattern
+            return result
         
         # Check for suspicious patterns
-        suspicious_patterns = ["test", "fake", "honeypot", "spam"]
-        for pattern in suspicious_patterns:
-            if pattern in banner_lower:
-                result["points"] = -8  # Random/weird → -8
-                return result
+        if _first_pattern(banner_lower, _SUSPICIOUS_BANNER_PATTERNS, _SUSPICIOUS_BANNER_AC) is not None:
+            result["points"] = -8  # Random/weird → -8
+            return result
         
         # No metadata or generic
         if len(banner_message.strip()) < 10:
@@ -1980,6 +3185,34 @@ class EmailVerifier:
         
         return result
     
+    def _get_dbl_bloom(self) -> Optional[_BloomFilter]:
+        """Return the DBL snapshot filter, (re)loading it when the file changed"""
+        if not self.dbl_snapshot_path:
+            return None
+        now = time.time()
+        if now - self._dbl_snapshot_checked_at < self.dbl_snapshot_refresh:
+            return self._dbl_bloom
+        with self._dbl_snapshot_lock:
+            if now - self._dbl_snapshot_checked_at < self.dbl_snapshot_refresh:
+                return self._dbl_bloom
+            self._dbl_snapshot_checked_at = now
+            try:
+                mtime = os.path.getmtime(self.dbl_snapshot_path)
+                if mtime != self._dbl_snapshot_mtime:
+                    with open(self.dbl_snapshot_path, encoding='utf-8', errors='ignore') as f:
+                        capacity = sum(1 for _ in f)
+                    bloom = _BloomFilter(capacity)
+                    with open(self.dbl_snapshot_path, encoding='utf-8', errors='ignore') as f:
+                        for line in f:
+                            listed = line.strip().lower()
+                            if listed and not listed.startswith('#'):
+                                bloom.add(listed)
+                    self._dbl_bloom = bloom
+                    self._dbl_snapshot_mtime = mtime
+            except OSError as e:
+                logger.debug(f"DBL snapshot load error: {str(e)}")
+        return self._dbl_bloom
+    
     def _check_domain_blacklists(self, domain: str) -> Dict:
         """25. Spamhaus DBL / Barracuda BL DNS Lookup"""
         result = {
@@ -1988,40 +3221,39 @@ class EmailVerifier:
             "sources_checked": []
         }
         
+        # A snapshot miss is definitive (Bloom filters have no false negatives)
+        dbl_bloom = self._get_dbl_bloom()
+        if dbl_bloom is not None and domain.lower() not in dbl_bloom:
+            result["sources_checked"].append("dbl_snapshot")
+            result["points"] = 10  # Clean → +10
+            return result
+        
+        cached = self._get_cached(self._domain_blacklist_cache, domain)
+        if cached:
+            return cached
+        
         try:
-            resolver = dns.resolver.Resolver()
-            resolver.timeout = 2.0
-            resolver.lifetime = 4.0
-            
-            # Spamhaus DBL check
-            try:
-                dbl_query = f"{domain}.dbl.spamhaus.org"
-                resolver.resolve(dbl_query, 'A')
-                result["blacklisted"] = True
-                result["points"] = -10  # Listed → -10
-                result["sources_checked"].append("spamhaus_dbl")
-                return result
-            except dns.resolver.NXDOMAIN:
-                result["sources_checked"].append("spamhaus_dbl")
-            
-            # SURBL check
-            try:
-                surbl_query = f"{domain}.multi.surbl.org"
-                resolver.resolve(surbl_query, 'A')
-                result["blacklisted"] = True
-                result["points"] = -10
-                result["sources_checked"].append("surbl")
-                return result
-            except dns.resolver.NXDOMAIN:
-                result["sources_checked"].append("surbl")
+            # Every zone is queried at once, so more zones cost no extra latency
+            listings = self._run_async(self._query_dnsbls(domain, DOMAIN_DNSBL_ZONES))
+            for source, listed in listings:
+                if listed is None:
+                    continue
+                result["sources_checked"].append(source)
+                if listed:
+                    result["blacklisted"] = True
+                    result["points"] = -10  # Listed → -10
             
-            # If not blacklisted
-            result["points"] = 10  # Clean → +10
+            if not result["blacklisted"]:
+                if any(listed is None for _, listed in listings):
+                    result["skipped"] = True
+                else:
+                    result["points"] = 10  # Clean → +10
             
         except Exception as e:
             logger.debug(f"Domain blacklist check error: {str(e)}")
             result["skipped"] = True
         
+        self._cache_result(self._domain_blacklist_cache, domain, result)
         return result
     
     def _check_quit_behavior(self, mx_host: str) -> Dict:
@@ -2031,31 +3263,29 @@ class EmailVerifier:
             "proper_quit": False
         }
         
+        cached = self._get_cached(self._mx_quit_cache, mx_host)
+        if cached:
+            return cached
+        
+        # QUIT ends the session, so it is checked out directly rather than via _acquire_smtp
         try:
-            server = smtplib.SMTP(timeout=5)
-            server.set_debuglevel(0)
-            
-            try:
-                server.connect(mx_host, 25)
-                server.ehlo()
-                
-                # Try to quit and check response
-                try:
-                    code, message = server.quit()
-                    if code == 221:
-                        result["proper_quit"] = True
-                        result["points"] = 4  # Proper QUIT → +4
-                    else:
-                        result["points"] = -4  # Unclean disconnect → -4
-                except:
-                    result["points"] = -4  # Unclean disconnect
-            except Exception as e:
-                logger.debug(f"QUIT behavior check error: {str(e)}")
-                result["skipped"] = True
+            server = self._get_smtp(mx_host, 5)
         except Exception as e:
-            logger.debug(f"QUIT connection error: {str(e)}")
+            logger.debug(f"QUIT behavior check error: {str(e)}")
             result["skipped"] = True
+        else:
+            try:
+                code, message = server.quit()
+                if code == 221:
+                    result["proper_quit"] = True
+                    result["points"] = 4  # Proper QUIT → +4
+                else:
+                    result["points"] = -4  # Unclean disconnect → -4
+            except (smtplib.SMTPException, OSError):
+                self._discard_smtp(server)
+                result["points"] = -4  # Unclean disconnect
         
+        self._cache_result(self._mx_quit_cache, mx_host, result)
         return result
     
     def _check_tcp_stability(self, mx_host: str) -> Dict:
@@ -2066,30 +3296,31 @@ class EmailVerifier:
             "retransmissions_detected": False
         }
         
-        # Note: True TCP retransmission detection requires low-level socket monitoring
-        # This is a simplified version that checks connection stability
-        
         try:
-            # Multiple connection attempts to check stability
-            stable_connections = 0
-            total_attempts = 3
-            
-            for _ in range(total_attempts):
-                try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(2)
-                    result_code = sock.connect_ex((mx_host, 25))
-                    sock.close()
-                    
-                    if result_code == 0:
-                        stable_connections += 1
-                except:
-                    pass
+            # Concurrent connection attempts; on Linux TCP_INFO reports SYN retransmissions.
+            # Each one holds a per-MX slot: wait for the first, take up to two more if free.
+            ip_address = self._resolve_mx_ip(mx_host)
+            slots = [self._take_mx_slot(mx_host)]
+            try:
+                for _ in range(2):
+                    slot = self._mx_slot(mx_host)
+                    if not slot.acquire(blocking=False):
+                        break
+                    slots.append(slot)
+                total_attempts = len(slots)
+                connected = self._connect_all(ip_address, [25] * total_attempts, 2)
+            finally:
+                for slot in slots:
+                    slot.release()
+            stable_connections = sum(retrans is not None for retrans in connected)
+            retransmissions = sum(retrans for retrans in connected if retrans is not None)
+            result["retransmissions"] = retransmissions
             
-            if stable_connections == total_attempts:
+            if stable_connections == total_attempts and not retransmissions:
                 result["stable"] = True
                 result["points"] = 5  # Stable → +5
             elif stable_connections >= total_attempts // 2:
+                result["retransmissions_detected"] = retransmissions > 0
                 result["points"] = 0
             else:
                 result["retransmissions_detected"] = True
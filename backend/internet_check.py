@@ -36,7 +36,27 @@ def _get_env_bool(key: str, default: bool = False) -> bool:
     return val.lower() in ('1', 'true', 'yes', 'on')
 
 
-def search_google(email: str, max_results: int = 5) -> Dict[str, Any]:
+def _build_session(status_forcelist: List[int], allowed_methods: List[str]) -> requests.Session:
+    """Session with retries and a keep-alive pool large enough for concurrent verifications"""
+    session = requests.Session()
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=status_forcelist,
+        allowed_methods=allowed_methods,
+    )
+    adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=retry_strategy)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared across calls so repeated lookups reuse TCP/TLS connections
+_GOOGLE_SESSION = _build_session([429, 500, 502, 503, 504, 403], ["GET", "POST"])
+_HIBP_SESSION = _build_session([429, 500, 502, 503, 504], ["GET"])
+
+
+def search_google(email: str, max_results: int = 5, session: Optional[requests.Session] = None) -> Dict[str, Any]:
     """
     Try to find the email via Google search.
 
@@ -48,16 +68,7 @@ def search_google(email: str, max_results: int = 5) -> Dict[str, Any]:
     cse_id = os.getenv('GOOGLE_CSE_ID')
 
     # Use a resilient requests session with retries
-    session = requests.Session()
-    retry_strategy = Retry(
-        total=3,
-        backoff_factor=1,
-        status_forcelist=[429, 500, 502, 503, 504, 403],
-        allowed_methods=["GET", "POST"],
-    )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
+    session = session or _GOOGLE_SESSION
 
     # Use UA rotation to try to minimize 403s when scraping
     # Use module-level UA list so other functions can reuse it when needed
@@ -130,7 +141,7 @@ def search_google(email: str, max_results: int = 5) -> Dict[str, Any]:
     return { 'count': len(results), 'results': results }
 
 
-def check_hibp(email: str) -> Dict[str, Any]:
+def check_hibp(email: str, session: Optional[requests.Session] = None) -> Dict[str, Any]:
     """
     Check Have I Been Pwned for breaches for the given email using the HIBP API
     Requires HIBP_API_KEY env var to be set; otherwise returns skipped.
@@ -142,16 +153,7 @@ def check_hibp(email: str) -> Dict[str, Any]:
 
     url = f'https://haveibeenpwned.com/api/v3/breachedaccount/{email}'
     # Use same session with retries for HIBP and sensible UA
-    session = requests.Session()
-    retry_strategy = Retry(
-        total=3,
-        backoff_factor=1,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["GET"],
-    )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
+    session = session or _HIBP_SESSION
 
     headers = {
         'hibp-api-key': api_key,
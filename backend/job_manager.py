@@ -6,46 +6,138 @@ from __future__ import annotations
 import threading
 import time
 import uuid
-from typing import Any, Dict, Optional
+from collections import OrderedDict, deque
+from types import MappingProxyType
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional, Tuple
 
+# Number of registry partitions; a power of two so the shard index is a single AND
+NUM_SHARDS = 16
 
-class JobManager:
-    """Thread-safe job registry used by bulk find/verify operations."""
+# Finished (completed or failed) jobs kept for status polls and downloads, oldest evicted first
+JOB_HISTORY_MAX = 256
+
+# Most recent error details kept per job
+MAX_JOB_ERRORS = 10
+
+_get_ident = threading.get_ident
+
+
+class _StripedCounter:
+    """Counter that is bumped without a lock: every thread adds to its own cell, which
+    no other thread writes, so no update is lost; reading sums the cells."""
+
+    __slots__ = ("_cells",)
 
     def __init__(self) -> None:
-        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._cells: Dict[int, int] = {}
+
+    def add(self, amount: int = 1) -> None:
+        cells = self._cells
+        ident = _get_ident()
+        cells[ident] = cells.get(ident, 0) + amount
+
+    @property
+    def value(self) -> int:
+        return sum(list(self._cells.values()))
+
+
+# Job fields copied into get_job snapshots
+_SNAPSHOT_FIELDS = (
+    "id", "type", "total_rows", "metadata", "status", "created_at", "started_at",
+    "finished_at", "message", "output_path", "output_filename", "errors",
+)
+
+
+class Job:
+    """Record of one bulk job; underscored fields are internal and left out of snapshots."""
+
+    __slots__ = _SNAPSHOT_FIELDS + (
+        "_processed", "_success", "_error", "_lock", "_created_monotonic", "_version", "_snapshot",
+    )
+
+    def __init__(self, id: str, type: str, total_rows: int, metadata: Dict[str, Any]) -> None:
+        self.id = id
+        self.type = type
+        self.total_rows = total_rows
+        self.metadata = metadata
+        self.status = "pending"
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.message: Optional[str] = None
+        self.output_path: Optional[str] = None
+        self.output_filename: Optional[str] = None
+        self.errors: Deque[str] = deque(maxlen=MAX_JOB_ERRORS)
+        self._processed = _StripedCounter()
+        self._success = _StripedCounter()
+        self._error = _StripedCounter()
         self._lock = threading.Lock()
+        self._created_monotonic = time.monotonic()
+        self._version = 0
+        self._snapshot: Optional[Tuple[Tuple[int, int], Mapping[str, Any]]] = None
+
+
+class JobManager:
+    """Thread-safe job registry used by bulk find/verify operations.
+
+    Jobs are spread over NUM_SHARDS dicts whose locks are only taken to insert;
+    lookups are plain dict reads (atomic in CPython). Each job carries its own
+    _lock guarding its fields, so rows of one job never wait on other jobs.
+    get_job takes no lock at all and reuses the job's last snapshot until
+    _version or the processed row count moves, so a polling progress bar
+    mostly costs two reads. Finished jobs move out of the shards into a
+    history LRU of at most history_max entries.
+    """
+
+    def __init__(self, history_max: int = JOB_HISTORY_MAX) -> None:
+        self._shards: List[Tuple[Dict[str, Job], threading.Lock]] = [
+            ({}, threading.Lock()) for _ in range(NUM_SHARDS)
+        ]
+        self._history: "OrderedDict[str, Job]" = OrderedDict()
+        self._history_lock = threading.Lock()
+        self._history_max = history_max
+
+    def _shard(self, job_id: str) -> Tuple[Dict[str, Job], threading.Lock]:
+        return self._shards[hash(job_id) & (NUM_SHARDS - 1)]
+
+    def _lookup(self, job_id: str) -> Optional[Job]:
+        jobs, _ = self._shard(job_id)
+        return jobs.get(job_id)
+
+    def _retire(self, job: Job) -> None:
+        # Into the history before out of the shard, so get_job never misses the job
+        job_id = job.id
+        with self._history_lock:
+            self._history[job_id] = job
+            self._history.move_to_end(job_id)
+            while len(self._history) > self._history_max:
+                self._history.popitem(last=False)
+        jobs, lock = self._shard(job_id)
+        with lock:
+            jobs.pop(job_id, None)
+
+    @staticmethod
+    def _stamp(job: Job) -> float:
+        # Wall-clock time derived from the monotonic clock, so durations measured
+        # against created_at are not skewed by wall-clock adjustments mid-job
+        return job.created_at + (time.monotonic() - job._created_monotonic)
 
     def create_job(self, job_type: str, total_rows: int, metadata: Optional[Dict[str, Any]] = None) -> str:
         job_id = str(uuid.uuid4())
-        job = {
-            "id": job_id,
-            "type": job_type,
-            "status": "pending",
-            "total_rows": total_rows,
-            "processed_rows": 0,
-            "success_rows": 0,
-            "error_rows": 0,
-            "created_at": time.time(),
-            "started_at": None,
-            "finished_at": None,
-            "message": None,
-            "output_path": None,
-            "output_filename": None,
-            "errors": [],
-            "metadata": metadata or {},
-        }
-        with self._lock:
-            self._jobs[job_id] = job
+        job = Job(id=job_id, type=job_type, total_rows=total_rows, metadata=metadata or {})
+        jobs, lock = self._shard(job_id)
+        with lock:
+            jobs[job_id] = job
         return job_id
 
     def start_job(self, job_id: str) -> None:
-        with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                return
-            job["status"] = "running"
-            job["started_at"] = time.time()
+        job = self._lookup(job_id)
+        if not job:
+            return
+        with job._lock:
+            job.status = "running"
+            job.started_at = self._stamp(job)
+            job._version += 1
 
     def increment(
         self,
@@ -55,49 +147,160 @@ class JobManager:
         message: Optional[str] = None,
         error_detail: Optional[str] = None,
     ) -> None:
-        with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                return
-            job["processed_rows"] += 1
-            if success:
-                job["success_rows"] += 1
-            else:
-                job["error_rows"] += 1
-                if error_detail:
-                    job["errors"].append(error_detail)
-                    # Keep error log short
-                    job["errors"] = job["errors"][-10:]
-            if message:
-                job["message"] = message
+        job = self._lookup(job_id)
+        if not job:
+            return
+        # Counters, the bounded error log and the message (a single store) need no lock.
+        # processed is bumped last: get_job keys its cached snapshot on it.
+        if success:
+            job._success.add()
+        else:
+            job._error.add()
+            if error_detail:
+                job.errors.append(error_detail)
+        if message:
+            job.message = message
+        job._processed.add()
+
+    def increment_many(
+        self,
+        job_id: str,
+        *,
+        success_delta: int = 0,
+        error_delta: int = 0,
+        error_details: Optional[Iterable[str]] = None,
+        message: Optional[str] = None,
+    ) -> None:
+        """Apply the outcomes of several rows at once (see ProgressBatch)."""
+        job = self._lookup(job_id)
+        if not job:
+            return
+        if success_delta:
+            job._success.add(success_delta)
+        if error_delta:
+            job._error.add(error_delta)
+        if error_details:
+            job.errors.extend(error_details)
+        if message:
+            job.message = message
+        job._processed.add(success_delta + error_delta)
+        if error_details or message:
+            # The processed count alone misses message- or error-only updates
+            with job._lock:
+                job._version += 1
+
+    def batched(self, job_id: str, max_rows: int = 64, max_delay: float = 1.0) -> "ProgressBatch":
+        return ProgressBatch(self, job_id, max_rows=max_rows, max_delay=max_delay)
 
     def complete_job(self, job_id: str, output_path: str, output_filename: str) -> None:
-        with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                return
-            job["status"] = "completed"
-            job["finished_at"] = time.time()
-            job["output_path"] = output_path
-            job["output_filename"] = output_filename
+        job = self._lookup(job_id)
+        if not job:
+            return
+        with job._lock:
+            job.status = "completed"
+            job.finished_at = self._stamp(job)
+            job.output_path = output_path
+            job.output_filename = output_filename
+            job._version += 1
+        self._retire(job)
 
     def fail_job(self, job_id: str, error_detail: str) -> None:
-        with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                return
-            job["status"] = "failed"
-            job["finished_at"] = time.time()
-            job["message"] = error_detail
-            job["errors"].append(error_detail)
-            job["errors"] = job["errors"][-10:]
-
-    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
-        with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                return None
-            # Return a shallow copy to avoid accidental external mutation
-            return dict(job)
+        job = self._lookup(job_id)
+        if not job:
+            return
+        with job._lock:
+            job.status = "failed"
+            job.finished_at = self._stamp(job)
+            job.message = error_detail
+            job.errors.append(error_detail)
+            job._version += 1
+        self._retire(job)
+
+    def totals(self) -> Tuple[int, int, int]:
+        """Processed, success and error rows summed over every tracked job, live or finished."""
+        # Keyed by id: a job being retired can briefly sit in both its shard and the history
+        with self._history_lock:
+            jobs = dict(self._history)
+        for shard, _ in self._shards:
+            jobs.update(shard)
+        processed = success = error = 0
+        for job in jobs.values():
+            processed += job._processed.value
+            success += job._success.value
+            error += job._error.value
+        return processed, success, error
+
+    def get_job(self, job_id: str) -> Optional[Mapping[str, Any]]:
+        job = self._lookup(job_id)
+        if not job:
+            with self._history_lock:
+                job = self._history.get(job_id)
+                if not job:
+                    return None
+                self._history.move_to_end(job_id)
+        # No lock: single attribute reads and stores are atomic under the CPython GIL, so each
+        # field is read whole, but fields may come from either side of a concurrent update
+        # (the row counts are approximate while a job runs). The key is read before the
+        # fields and writers bump it after theirs, so a snapshot caught mid-update is
+        # cached under a stale key and rebuilt on the next call.
+        key = (job._version, job._processed.value)
+        cached = job._snapshot
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        # Read-only view, so one snapshot can be handed to every poller
+        values = {name: getattr(job, name) for name in _SNAPSHOT_FIELDS}
+        values["errors"] = tuple(job.errors)
+        values["processed_rows"] = job._processed.value
+        values["success_rows"] = job._success.value
+        values["error_rows"] = job._error.value
+        snapshot = MappingProxyType(values)
+        job._snapshot = (key, snapshot)
+        return snapshot
+
+
+class ProgressBatch:
+    """Collects per-row outcomes of one job and applies them with increment_many
+    every max_rows rows or max_delay seconds, whichever comes first, and on exit."""
+
+    def __init__(self, manager: JobManager, job_id: str, max_rows: int = 64, max_delay: float = 1.0) -> None:
+        self._manager = manager
+        self._job_id = job_id
+        self._max_rows = max_rows
+        self._max_delay = max_delay
+        self._reset()
+
+    def _reset(self) -> None:
+        self._success = 0
+        self._error = 0
+        self._error_details: List[str] = []
+        self._message: Optional[str] = None
+        self._flush_at = time.monotonic() + self._max_delay
+
+    def add(self, *, success: bool, message: Optional[str] = None, error_detail: Optional[str] = None) -> None:
+        if success:
+            self._success += 1
+        else:
+            self._error += 1
+            if error_detail:
+                self._error_details.append(error_detail)
+        if message:
+            self._message = message
+        if self._success + self._error >= self._max_rows or time.monotonic() >= self._flush_at:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._success or self._error:
+            self._manager.increment_many(
+                self._job_id,
+                success_delta=self._success,
+                error_delta=self._error,
+                error_details=self._error_details,
+                message=self._message,
+            )
+        self._reset()
 
+    def __enter__(self) -> "ProgressBatch":
+        return self
 
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
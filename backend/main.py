@@ -41,6 +41,14 @@ finder = EmailFinder()
 verifier = EmailVerifier()
 job_manager = JobManager()
 bulk_executor = ThreadPoolExecutor(max_workers=4)
+# Rows of a bulk verify job handed to verifier.verify_batch at a time
+BULK_VERIFY_CHUNK_ROWS = 200
+
+
+@app.on_event("shutdown")
+def close_smtp_sessions():
+    verifier.close()
+    finder.verifier.close()
 
 
 # Request models
@@ -350,7 +358,7 @@ def process_bulk_find_job(
         output_path = os.path.join(tempfile.gettempdir(), filename)
         fieldnames = ['first_name', 'last_name', 'domain', 'email', 'status', 'confidence', 'reason']
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile, job_manager.batched(job_id) as progress:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             
@@ -369,7 +377,7 @@ def process_bulk_find_job(
                         'confidence': 0.0,
                         'reason': 'Required fields missing'
                     })
-                    job_manager.increment(job_id, success=False, error_detail="Missing required fields")
+                    progress.add(success=False, error_detail="Missing required fields")
                     continue
                 
                 try:
@@ -393,7 +401,7 @@ def process_bulk_find_job(
                             'confidence': result['confidence'],
                             'reason': result.get('reason', '')
                         })
-                        job_manager.increment(job_id, success=True, message=result['status'])
+                        progress.add(success=True, message=result['status'])
                     else:
                         writer.writerow({
                             'first_name': first,
@@ -404,7 +412,7 @@ def process_bulk_find_job(
                             'confidence': 0.0,
                             'reason': 'No valid email found'
                         })
-                        job_manager.increment(job_id, success=False, message="not_found")
+                        progress.add(success=False, message="not_found")
                 except Exception as exc:
                     writer.writerow({
                         'first_name': first,
@@ -415,7 +423,7 @@ def process_bulk_find_job(
                         'confidence': 0.0,
                         'reason': str(exc)
                     })
-                    job_manager.increment(job_id, success=False, error_detail=str(exc))
+                    progress.add(success=False, error_detail=str(exc))
         
         job_manager.complete_job(job_id, output_path, filename)
     except Exception as exc:
@@ -443,29 +451,44 @@ def process_bulk_verify_job(
         output_path = os.path.join(tempfile.gettempdir(), filename)
         fieldnames = ['email', 'status', 'score', 'confidence', 'reason']
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+        with open(output_path, 'w', newline='', encoding='utf-8') as csvfile, job_manager.batched(job_id) as progress:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
             
-            for _, row in df.iterrows():
-                email = _normalize_cell(row.get('email', ''))
-                if not email:
-                    writer.writerow({
-                        'email': '',
-                        'status': 'missing_email',
-                        'confidence': 0.0,
-                        'reason': 'Email value missing'
-                    })
-                    job_manager.increment(job_id, success=False, error_detail="Email value missing")
-                    continue
-                
+            def write_chunk(chunk: List[str]) -> None:
+                # Rows sharing a domain share its DNS/MX checks and pooled SMTP sessions
+                emails = [email for email in chunk if email]
                 try:
-                    verification = verifier.verify_email(
-                        email,
+                    results = iter(verifier.verify_batch(
+                        emails,
                         fast_mode=fast_mode,
                         confidence_mode=confidence_mode,
                         internet_checks=internet_checks,
-                    )
+                    ))
+                except Exception as exc:
+                    results = iter([{'status': 'error', 'reason': str(exc)}] * len(emails))
+                
+                for email in chunk:
+                    if not email:
+                        writer.writerow({
+                            'email': '',
+                            'status': 'missing_email',
+                            'confidence': 0.0,
+                            'reason': 'Email value missing'
+                        })
+                        progress.add(success=False, error_detail="Email value missing")
+                        continue
+                    
+                    verification = next(results)
+                    if verification['status'] == 'error':
+                        writer.writerow({
+                            'email': email,
+                            'status': 'error',
+                            'confidence': 0.0,
+                            'reason': verification.get('reason', '')
+                        })
+                        progress.add(success=False, error_detail=verification.get('reason', ''))
+                        continue
                     writer.writerow({
                         'email': email,
                         'status': verification['status'],
@@ -473,15 +496,16 @@ def process_bulk_verify_job(
                         'confidence': verification['confidence'],
                         'reason': verification.get('reason', '')
                     })
-                    job_manager.increment(job_id, success=True, message=verification['status'])
-                except Exception as exc:
-                    writer.writerow({
-                        'email': email,
-                        'status': 'error',
-                        'confidence': 0.0,
-                        'reason': str(exc)
-                    })
-                    job_manager.increment(job_id, success=False, error_detail=str(exc))
+                    progress.add(success=True, message=verification['status'])
+            
+            chunk: List[str] = []
+            for _, row in df.iterrows():
+                chunk.append(_normalize_cell(row.get('email', '')))
+                if len(chunk) >= BULK_VERIFY_CHUNK_ROWS:
+                    write_chunk(chunk)
+                    chunk = []
+            if chunk:
+                write_chunk(chunk)
         
         job_manager.complete_job(job_id, output_path, filename)
     except Exception as exc:
@@ -0,0 +1,283 @@
+"""Tests for the SMTP session pool and lookup helpers of EmailVerifier.
+
+SMTP runs against a local stub server and MX names resolve to it without DNS,
+so no test leaves the machine.
+"""
+import os
+import smtplib
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+import email_verifier
+from email_verifier import EmailVerifier, SMTPSlotUnavailable, _BloomFilter, _first_pattern
+
+MX = "mx.stub.test"
+
+
+class _StubSMTPHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        try:
+            time.sleep(server.greeting_delay)
+            self.wfile.write(b"220 stub.test ESMTP\r\n")
+            for line in self.rfile:
+                command = line[:4].upper()
+                if command == b"EHLO":
+                    self.wfile.write(b"250-stub.test\r\n250 PIPELINING\r\n")
+                elif command == b"QUIT":
+                    self.wfile.write(b"221 Bye\r\n")
+                    with server.lock:
+                        server.quits += 1
+                    return
+                else:
+                    if command == b"RCPT":
+                        with server.lock:
+                            server.rcpts += 1
+                    self.wfile.write(b"250 OK\r\n")
+        except OSError:
+            # Pooled sessions are dropped with an RST
+            pass
+
+
+class _StubSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _StubSMTPHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.rcpts = 0
+        self.quits = 0
+        self.greeting_delay = 0.0
+
+
+@pytest.fixture
+def smtp_stub():
+    server = _StubSMTPServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def verifier(monkeypatch):
+    v = EmailVerifier()
+    # Stub resolver: every MX host is the local stub server
+    monkeypatch.setattr(v, "_mx_address", lambda mx_host: "127.0.0.1")
+    v.smtp_max_sessions_per_mx = 1
+    v.smtp_slot_wait = 0.3
+    return v
+
+
+def _route_port_25_to(monkeypatch, port):
+    """Checks always dial port 25; send those connections to the stub instead"""
+    def connect(self, host='localhost', port_=0, source_address=None):
+        return smtplib.SMTP.connect(self, host, port, source_address)
+    monkeypatch.setattr(email_verifier._PooledSMTP, "connect", connect)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_pooled_session_is_reused_across_emails(verifier, smtp_stub):
+    port = smtp_stub.server_address[1]
+    for email in ("alice@stub.test", "bob@stub.test", "carol@stub.test"):
+        with verifier._acquire_smtp(MX, 5, port) as server:
+            server.mail("verify@example.com")
+            assert server.rcpt(email)[0] == 250
+    assert smtp_stub.rcpts == 3
+    assert smtp_stub.connections == 1
+
+
+def test_pooled_session_rcpt_timing_includes_handshake(verifier, smtp_stub, monkeypatch):
+    _route_port_25_to(monkeypatch, smtp_stub.server_address[1])
+    smtp_stub.greeting_delay = 1.2
+    connection = {"port_25_open": True, "mx_used": MX}
+    fresh = verifier._check_smtp_rcpt("alice@stub.test", "stub.test", [MX], connection)
+    pooled = verifier._check_smtp_rcpt("bob@stub.test", "stub.test", [MX], connection)
+
+    assert smtp_stub.connections == 1
+    for result in (fresh, pooled):
+        assert result["accepted"]
+        assert result["timing"]["response_time_sec"] >= 1
+        assert result["timing"]["points"] == 5  # normal latency, not a quick reject
+
+
+def test_slot_exhaustion_times_out(verifier, smtp_stub, monkeypatch):
+    port = smtp_stub.server_address[1]
+    _route_port_25_to(monkeypatch, port)
+    held = verifier._get_smtp(MX, 5, port)
+    try:
+        started = time.time()
+        with pytest.raises(SMTPSlotUnavailable):
+            verifier._get_smtp(MX, 5, port)
+        assert time.time() - started >= verifier.smtp_slot_wait
+
+        # Our own connection cap is scored as a skipped check, never as a dead server
+        probe = verifier._probe_mx(MX, 5, 5)
+        assert probe["skipped"] and probe["points"] == 0
+        connection = {"port_25_open": True, "mx_used": MX}
+        rcpt = verifier._check_smtp_rcpt("alice@stub.test", "stub.test", [MX], connection)
+        assert rcpt["skipped"]
+        assert rcpt["error"] is None
+        assert rcpt["points"] == 0 and rcpt["timing"]["points"] == 0
+        assert verifier._classify_smtp_error_pattern(rcpt, connection) == {
+            "category": "unknown", "points": 0, "pattern": None,
+        }
+    finally:
+        verifier._discard_smtp(held)
+
+
+def test_waiting_checkout_picks_up_released_session(verifier, smtp_stub):
+    port = smtp_stub.server_address[1]
+    held = verifier._get_smtp(MX, 5, port)
+    verifier.smtp_slot_wait = 5
+    threading.Timer(0.1, verifier._release_smtp, (MX, held, port)).start()
+    server = verifier._get_smtp(MX, 5, port)
+    try:
+        assert server is held
+        assert smtp_stub.connections == 1
+    finally:
+        verifier._discard_smtp(server)
+
+
+def test_closing_a_session_releases_its_slot(verifier, smtp_stub):
+    port = smtp_stub.server_address[1]
+    verifier._discard_smtp(verifier._get_smtp(MX, 5, port))
+    server = verifier._get_smtp(MX, 5, port)
+    verifier._discard_smtp(server)
+    assert smtp_stub.connections == 2
+    assert server.mx_slot is None
+    assert verifier._mx_slot(MX).acquire(blocking=False)
+
+
+def test_take_mx_slot_closes_idle_session_inline(verifier, smtp_stub):
+    port = smtp_stub.server_address[1]
+    with verifier._acquire_smtp(MX, 5, port):
+        pass
+    # The only slot is held by the idle pooled session; taking it must not wait
+    # on anything queued to another pool
+    verifier._executor.shutdown(wait=True)
+    started = time.time()
+    slot = verifier._take_mx_slot(MX)
+    slot.release()
+    assert time.time() - started < verifier.smtp_slot_wait
+    assert not verifier._smtp_pool.get((MX, port))
+
+
+def test_expired_idle_session_is_swept_while_another_mx_is_used(verifier, smtp_stub):
+    port = smtp_stub.server_address[1]
+    verifier.smtp_pool_ttl = 0.3
+    verifier.smtp_sweep_interval = 0
+    with verifier._acquire_smtp("mx-a.stub.test", 5, port):
+        pass
+    assert verifier._smtp_pool[("mx-a.stub.test", port)]
+    time.sleep(0.4)
+    with verifier._acquire_smtp("mx-b.stub.test", 5, port):
+        pass
+    assert ("mx-a.stub.test", port) not in verifier._smtp_pool
+    assert verifier._mx_slot("mx-a.stub.test").acquire(blocking=False)
+
+
+def test_close_signs_off_idle_sessions(verifier, smtp_stub):
+    port = smtp_stub.server_address[1]
+    with verifier._acquire_smtp(MX, 5, port):
+        pass
+    verifier.close()
+    assert _wait_for(lambda: smtp_stub.quits == 1)
+    assert verifier._mx_slot(MX).acquire(timeout=2)
+
+
+def test_tcp_stability_connects_within_the_slot_cap(verifier, monkeypatch):
+    verifier.smtp_max_sessions_per_mx = 2
+    attempts = []
+
+    def connect_all(ip_address, ports, timeout):
+        attempts.append(len(ports))
+        # Every connection of the probe holds a slot, so none is left over
+        assert not verifier._mx_slot(MX).acquire(blocking=False)
+        return [0] * len(ports)
+
+    monkeypatch.setattr(verifier, "_resolve_mx_ip", lambda mx_host: "127.0.0.1")
+    monkeypatch.setattr(verifier, "_connect_all", connect_all)
+    result = verifier._check_tcp_stability(MX)
+
+    assert attempts == [2]
+    assert result["stable"]
+    assert verifier._mx_slot(MX).acquire(blocking=False)
+    assert verifier._mx_slot(MX).acquire(blocking=False)
+
+
+def test_verify_batch_shares_domain_prefetch(verifier, monkeypatch):
+    prefetched = []
+    verified = []
+
+    def prefetch_domain(domain, fast_mode=True):
+        prefetched.append(domain)
+        return {"dns_health": {"mx_hosts": [f"mx.{domain}"]}}
+
+    def verify_with_prefetched(email, domain_results, *args):
+        verified.append((email, domain_results["dns_health"]["mx_hosts"]))
+        return {"email": email}
+
+    monkeypatch.setattr(verifier, "_prefetch_domain", prefetch_domain)
+    monkeypatch.setattr(verifier, "_verify_with_prefetched", verify_with_prefetched)
+    emails = ["a@one.test", "b@two.test", "c@one.test"]
+    results = verifier.verify_batch(emails, max_workers=4)
+
+    assert [r["email"] for r in results] == emails
+    assert sorted(prefetched) == ["one.test", "two.test"]
+    assert dict(verified)["c@one.test"] == ["mx.one.test"]
+
+
+def test_connect_all_reports_open_and_closed_ports():
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    closed = socket.socket()
+    closed.bind(("127.0.0.1", 0))
+    closed_port = closed.getsockname()[1]
+    closed.close()
+    try:
+        open_result, closed_result = EmailVerifier._connect_all(
+            "127.0.0.1", [listener.getsockname()[1], closed_port], 1.0
+        )
+    finally:
+        listener.close()
+    assert open_result == 0  # connected, no retransmissions on loopback
+    assert closed_result is None
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = _BloomFilter(1000)
+    domains = [f"listed{i}.test" for i in range(1000)]
+    for domain in domains:
+        bloom.add(domain)
+    assert all(domain in bloom for domain in domains)
+    false_positives = sum(f"clean{i}.test" in bloom for i in range(1000))
+    assert false_positives < 10
+
+
+@pytest.mark.parametrize("automaton", [None, email_verifier._TRUSTED_MX_AC])
+def test_first_pattern_follows_list_order(automaton):
+    patterns = list(email_verifier._TRUSTED_MX_BRANDS)
+    assert _first_pattern("aspmx.l.google.com", patterns, automaton) == "google.com"
+    # Several brands match; the one listed first wins
+    assert _first_pattern("relay.mailgun.org.outlook.com", patterns, automaton) == "outlook.com"
+    assert _first_pattern("mx.unknown.test", patterns, automaton) is None
@@ -0,0 +1,121 @@
+"""Tests for the in-memory JobManager used by the bulk CSV endpoints."""
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from job_manager import JOB_HISTORY_MAX, MAX_JOB_ERRORS, JobManager
+
+
+def test_batched_progress_from_many_threads_adds_up():
+    manager = JobManager()
+    job_id = manager.create_job("bulk_verify", total_rows=8 * 1000)
+    manager.start_job(job_id)
+
+    def worker(index):
+        with manager.batched(job_id, max_rows=64) as progress:
+            for row in range(1000):
+                progress.add(success=row % 4 != 0, error_detail=f"worker {index} row {row}")
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    job = manager.get_job(job_id)
+    assert job["processed_rows"] == 8000
+    assert job["success_rows"] == 6000
+    assert job["error_rows"] == 2000
+    assert len(job["errors"]) == MAX_JOB_ERRORS
+    assert manager.totals() == (8000, 6000, 2000)
+
+
+def test_batch_flushes_every_max_rows():
+    manager = JobManager()
+    job_id = manager.create_job("bulk_find", total_rows=10)
+    with manager.batched(job_id, max_rows=4, max_delay=60) as progress:
+        for _ in range(5):
+            progress.add(success=True)
+        assert manager.get_job(job_id)["processed_rows"] == 4
+    assert manager.get_job(job_id)["processed_rows"] == 5
+
+
+def test_message_only_update_refreshes_cached_snapshot():
+    manager = JobManager()
+    job_id = manager.create_job("bulk_find", total_rows=1)
+    assert manager.get_job(job_id)["message"] is None
+    manager.increment_many(job_id, message="hello")
+    assert manager.get_job(job_id)["message"] == "hello"
+    manager.increment_many(job_id, error_details=["boom"])
+    assert manager.get_job(job_id)["errors"] == ("boom",)
+
+
+def test_snapshot_is_read_only():
+    manager = JobManager()
+    job_id = manager.create_job("bulk_find", total_rows=1)
+    job = manager.get_job(job_id)
+    with pytest.raises(TypeError):
+        job["status"] = "completed"
+
+
+def test_get_job_after_complete_job():
+    manager = JobManager()
+    job_id = manager.create_job("bulk_verify", total_rows=2)
+    manager.start_job(job_id)
+    manager.increment(job_id, success=True, message="valid")
+    manager.increment(job_id, success=False, error_detail="timeout")
+    manager.complete_job(job_id, "/tmp/out.csv", "out.csv")
+
+    job = manager.get_job(job_id)
+    assert job["status"] == "completed"
+    assert job["output_path"] == "/tmp/out.csv"
+    assert job["output_filename"] == "out.csv"
+    assert (job["processed_rows"], job["success_rows"], job["error_rows"]) == (2, 1, 1)
+    assert job["errors"] == ("timeout",)
+    assert job["started_at"] <= job["finished_at"]
+
+
+def test_get_job_after_fail_job():
+    manager = JobManager()
+    job_id = manager.create_job("bulk_find", total_rows=1)
+    manager.fail_job(job_id, "bad csv")
+    job = manager.get_job(job_id)
+    assert job["status"] == "failed"
+    assert job["message"] == "bad csv"
+
+
+def test_history_evicts_least_recently_used_finished_job():
+    manager = JobManager()
+    job_ids = [manager.create_job("bulk_find", total_rows=1) for _ in range(JOB_HISTORY_MAX + 1)]
+    manager.complete_job(job_ids[0], "/tmp/0.csv", "0.csv")
+    manager.complete_job(job_ids[1], "/tmp/1.csv", "1.csv")
+    # Polling the oldest job makes the second one the least recently used
+    assert manager.get_job(job_ids[0]) is not None
+    for job_id in job_ids[2:]:
+        manager.complete_job(job_id, "/tmp/out.csv", "out.csv")
+
+    assert manager.get_job(job_ids[1]) is None
+    assert manager.get_job(job_ids[0])["status"] == "completed"
+    assert manager.get_job(job_ids[-1])["status"] == "completed"
+    assert len(manager._history) == JOB_HISTORY_MAX
+
+
+def test_live_jobs_are_never_evicted():
+    manager = JobManager(history_max=1)
+    running = manager.create_job("bulk_find", total_rows=1)
+    for _ in range(3):
+        manager.complete_job(manager.create_job("bulk_find", total_rows=1), "/tmp/out.csv", "out.csv")
+    assert manager.get_job(running)["status"] == "pending"
+
+
+def test_unknown_job_is_ignored():
+    manager = JobManager()
+    manager.increment("missing", success=True)
+    manager.increment_many("missing", success_delta=3)
+    manager.complete_job("missing", "/tmp/out.csv", "out.csv")
+    assert manager.get_job("missing") is None
+    assert manager.totals() == (0, 0, 0)
@@ -0,0 +1,47 @@
+"""Tests for the bulk CSV jobs run by the API."""
+import csv
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+import main
+
+
+def test_bulk_verify_job_verifies_rows_in_batches(tmp_path, monkeypatch):
+    batches = []
+
+    def verify_batch(emails, **options):
+        batches.append(list(emails))
+        return [
+            {"email": email, "status": "error", "reason": "boom"} if email.startswith("bad")
+            else {"email": email, "status": "valid", "score": 90, "confidence": 0.9, "reason": "ok"}
+            for email in emails
+        ]
+
+    def verify_email(*args, **kwargs):
+        raise AssertionError("bulk jobs must go through verify_batch")
+
+    monkeypatch.setattr(main, "BULK_VERIFY_CHUNK_ROWS", 2)
+    monkeypatch.setattr(main.verifier, "verify_batch", verify_batch)
+    monkeypatch.setattr(main.verifier, "verify_email", verify_email)
+    input_path = tmp_path / "input.csv"
+    input_path.write_text("email,name\na@x.test,A\n,B\nbad@x.test,C\nb@y.test,D\nc@x.test,E\n")
+    job_id = main.job_manager.create_job("bulk_verify", total_rows=5)
+
+    main.process_bulk_verify_job(job_id, str(input_path), True, "balanced")
+
+    job = main.job_manager.get_job(job_id)
+    assert job["status"] == "completed"
+    assert (job["processed_rows"], job["success_rows"], job["error_rows"]) == (5, 3, 2)
+    assert batches == [["a@x.test"], ["bad@x.test", "b@y.test"], ["c@x.test"]]
+    with open(job["output_path"], newline="", encoding="utf-8") as output:
+        rows = list(csv.DictReader(output))
+    os.remove(job["output_path"])
+    assert [(row["email"], row["status"]) for row in rows] == [
+        ("a@x.test", "valid"),
+        ("", "missing_email"),
+        ("bad@x.test", "error"),
+        ("b@y.test", "valid"),
+        ("c@x.test", "valid"),
+    ]